@@ -7,10 +7,11 @@ PDF RAG HTTP server authentication system.
 
 import sys
 from getpass import getpass
-from passlib.context import CryptContext
 
-# Create password context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+import bcrypt
+
+# Match the cost factor used by the HTTP server
+BCRYPT_ROUNDS = 12
 
 
 def main():
@@ -32,7 +33,9 @@ def main():
         sys.exit(1)
     
     # Generate hash
-    hash_value = pwd_context.hash(password)
+    hash_value = bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+    ).decode("ascii")
     
     print()
     print("Generated password hash:")
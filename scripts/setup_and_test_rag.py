@@ -2,10 +2,13 @@
 """Setup and test the RAG system with PDF documents."""
 
 import asyncio
+import logging
 from pathlib import Path
 
 from mcp_server_simple import SimplePDFRAGMCPServer
 
+logger = logging.getLogger(__name__)
+
 
 async def setup_and_test():
     """Setup RAG system and test with questions."""
@@ -100,11 +103,8 @@ async def main():
         await setup_and_test()
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user.")
-    except Exception as e:
-        print(f"\nError: {e}")
-        import traceback
-
-        traceback.print_exc()
+    except Exception:
+        logger.exception("RAG setup and test failed")
 
 
 if __name__ == "__main__":
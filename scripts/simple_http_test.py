@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Simple test to verify HTTP server starts correctly."""
 
+import logging
 import os
 import sys
 from pathlib import Path
@@ -16,6 +17,8 @@ os.environ.update({
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+logger = logging.getLogger(__name__)
+
 try:
     print("Testing HTTP server imports...")
     from src.mcp.http_server import app, server
@@ -35,8 +38,6 @@ try:
     
     print("\n✅ All imports and basic functionality work!")
     
-except Exception as e:
-    print(f"\n❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
+except Exception:
+    logger.exception("❌ HTTP server smoke test failed")
     sys.exit(1)
\ No newline at end of file
@@ -2,6 +2,7 @@
 """End-to-end test for HTTP server functionality."""
 
 import asyncio
+import logging
 import os
 import subprocess
 import sys
@@ -14,6 +15,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.mcp.http_client import PDFRAGClient
 
+logger = logging.getLogger(__name__)
+
 
 def create_test_pdf(path: Path) -> None:
     """Create a simple test PDF."""
@@ -180,10 +183,8 @@ def run_tests():
             
             print("\n✅ All tests passed!")
             
-        except Exception as e:
-            print(f"\n❌ Test failed: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("❌ Test failed")
             sys.exit(1)
         
         finally:
@@ -9,17 +9,20 @@ This script tests the rotating log handler implementation by:
 
 import os
 import sys
-import time
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.mcp.logging_config import configure_mcp_logging, log_system_info
+from src.mcp.logging_config import configure_mcp_logging, flush_logger, log_system_info
 
 
-def test_log_rotation():
-    """Test log rotation functionality."""
+def test_log_rotation() -> bool:
+    """Test log rotation functionality.
+
+    Returns:
+        True if backup files were created and no file exceeds the size limit
+    """
     print("Testing log rotation functionality...")
     
     # Configure logger with small max_bytes for testing
@@ -51,23 +54,30 @@ def test_log_rotation():
         if i % 10 == 0:
             print(f"  Generated {i+1} sets of messages...")
     
-    # Wait a moment for file operations
-    time.sleep(0.5)
+    # Records are written by a background listener; wait until all are on disk
+    flush_logger(logger)
     
     # Check for rotated files
     print("\nChecking for rotated log files:")
     log_files = sorted(log_dir.glob("test_server.log*"))
     
+    max_bytes = int(os.environ['MCP_LOG_MAX_BYTES'])
+    oversized = []
     for log_file in log_files:
         size = log_file.stat().st_size
         print(f"  {log_file.name}: {size:,} bytes")
+        if size > max_bytes:
+            oversized.append(log_file.name)
     
-    # Verify rotation occurred
+    # Verify rotation occurred and kept every file within the size limit
     backup_files = [f for f in log_files if f.name != "test_server.log"]
+    passed = bool(backup_files) and not oversized
     if backup_files:
         print(f"\n✅ Log rotation successful! Found {len(backup_files)} backup files.")
     else:
         print("\n❌ No backup files found. Log rotation may not have been triggered.")
+    if oversized:
+        print(f"❌ Files larger than {max_bytes:,} bytes: {', '.join(oversized)}")
     
     # Test with different log levels
     print("\nTesting different log levels:")
@@ -83,6 +93,7 @@ def test_log_rotation():
     
     print("\n✅ Log rotation test completed!")
     print(f"Check the log files in: {log_dir}")
+    return passed
 
 
 def cleanup_test_logs():
@@ -109,4 +120,4 @@ if __name__ == "__main__":
     if args.cleanup:
         cleanup_test_logs()
     else:
-        test_log_rotation()
\ No newline at end of file
+        sys.exit(0 if test_log_rotation() else 1)
\ No newline at end of file
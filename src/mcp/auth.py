@@ -4,15 +4,25 @@ This module provides JWT-based authentication and API key support
 for the PDF RAG HTTP server.
 """
 
+import asyncio
+import hashlib
+import hmac
 import os
 import secrets
-from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
-
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Optional, Dict
+
+import bcrypt
+import orjson
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, APIKeyHeader
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from jose import JWTError, jws, jwt
+from jose.exceptions import JOSEError
 from pydantic import BaseModel
 
 # Security configuration
@@ -26,7 +36,9 @@ ACCESS_TOKEN_EXPIRE_MINUTES = 60  # 1 hour (reduced from 24 hours)
 API_KEY_HEADER_NAME = "X-API-Key"
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+BCRYPT_ROUNDS = 12
+# Verified against when the username is unknown, to equalize login timing
+_DUMMY_HASH = bcrypt.hashpw(secrets.token_bytes(16), bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
 
 # Security schemes
 bearer_scheme = HTTPBearer(auto_error=False)
@@ -34,34 +46,64 @@ api_key_scheme = APIKeyHeader(name=API_KEY_HEADER_NAME, auto_error=False)
 
 # SECURITY: Load users from environment or config file, not hardcoded
 # In production, use a proper database (PostgreSQL, Redis, etc.)
-DEMO_USERS = {}
+_DEMO_USERS: Dict[str, dict] = {}
+
+# Pre-encode the admin hash once so the login path skips per-call str -> bytes conversion
+ADMIN_PASSWORD_HASH_BYTES = os.environ.get("ADMIN_PASSWORD_HASH", "").encode("ascii")
 
 # Load admin user from environment if provided
-if os.environ.get("ADMIN_USERNAME") and os.environ.get("ADMIN_PASSWORD_HASH"):
-    DEMO_USERS[os.environ["ADMIN_USERNAME"]] = {
+if os.environ.get("ADMIN_USERNAME") and ADMIN_PASSWORD_HASH_BYTES:
+    _DEMO_USERS[os.environ["ADMIN_USERNAME"]] = {
         "username": os.environ["ADMIN_USERNAME"],
         "hashed_password": os.environ["ADMIN_PASSWORD_HASH"],
+        "hashed_password_b": ADMIN_PASSWORD_HASH_BYTES,
         "is_active": True,
         "is_admin": True,
     }
 
 # API Keys for service-to-service auth
 # SECURITY: Load from environment only, no defaults
-API_KEYS = {}
+_API_KEYS: Dict[str, dict] = {}
 if os.environ.get("API_KEYS"):
     # Format: "key1:name1:limit1,key2:name2:limit2"
     for key_config in os.environ["API_KEYS"].split(","):
         parts = key_config.strip().split(":")
         if len(parts) == 3:
             key, name, limit = parts
-            API_KEYS[key] = {
+            _API_KEYS[key] = {
                 "name": name,
                 "is_active": True,
                 "rate_limit": int(limit),
             }
 
-# Rate limiting storage (in-memory for demo)
-rate_limit_storage: Dict[str, Dict[str, Any]] = {}
+# Users and keys are fixed after import; expose read-only views so request
+# handlers cannot mutate shared state and derived caches never go stale
+DEMO_USERS = MappingProxyType(_DEMO_USERS)
+API_KEYS = MappingProxyType(_API_KEYS)
+
+# SHA-256 digests of the configured keys, used for constant-time lookups
+API_KEY_HASHES = MappingProxyType({
+    hashlib.sha256(key.encode()).digest(): key_data
+    for key, key_data in _API_KEYS.items()
+})
+
+# Verified JWT payloads keyed by token digest; entries also honour the token's own exp
+JWT_CACHE_TTL_SECONDS = 30
+_jwt_cache: TTLCache = TTLCache(maxsize=10000, ttl=JWT_CACHE_TTL_SECONDS)
+_jwt_cache_lock = threading.Lock()
+
+# Successful login verifications keyed by HMAC(SECRET_KEY, password + hash) so cached
+# keys cannot be used to recover passwords
+_pw_cache: TTLCache = TTLCache(maxsize=1024, ttl=60)
+_pw_cache_hmac_key = SECRET_KEY.encode()
+_pw_cache_lock = threading.Lock()
+
+# Rate limiting window length; timestamps are integer monotonic seconds
+RATE_LIMIT_WINDOW_SECONDS = 3600
+
+# Rate limiting storage (in-memory for demo), capped with LRU eviction
+RATE_LIMIT_MAX_TRACKED = 100_000
+rate_limit_storage: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
 
 
 class User(BaseModel):
@@ -71,6 +113,13 @@ class User(BaseModel):
     is_admin: bool = False
 
 
+# Constructed User models keyed by (auth source, name). The source keeps a
+# demo user and an API key with the same name from sharing an entry (and
+# its is_admin flag). DEMO_USERS and API_KEYS are read-only views, so
+# entries never need invalidation.
+_user_obj_cache: Dict[tuple[str, str], User] = {}
+
+
 class Token(BaseModel):
     """Token response model."""
     access_token: str
@@ -83,34 +132,85 @@ class LoginRequest(BaseModel):
     password: str
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against a hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+def verify_password(plain_password: str, hashed_password: str | bytes) -> bool:
+    """Verify a password against a bcrypt hash (str or pre-encoded bytes)."""
+    if isinstance(hashed_password, str):
+        hashed_password = hashed_password.encode("ascii")
+    try:
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password)
+    except ValueError:
+        return False
+
+
+def _verify_password_cached(plain_password: str, hashed_password: str | bytes) -> bool:
+    """Verify a password, reusing recent successes for identical (password, hash) pairs.
+    
+    Only successful verifications are cached, so failed attempts always pay
+    the full bcrypt cost and cache hits cannot be used for enumeration.
+    """
+    if isinstance(hashed_password, str):
+        hashed_password = hashed_password.encode("ascii")
+    cache_key = hmac.new(
+        _pw_cache_hmac_key,
+        plain_password.encode("utf-8") + b"\0" + hashed_password,
+        hashlib.sha256,
+    ).digest()
+    with _pw_cache_lock:
+        result = _pw_cache.get(cache_key)
+    if result is not None:
+        return result
+    
+    result = verify_password(plain_password, hashed_password)
+    if result:
+        with _pw_cache_lock:
+            _pw_cache[cache_key] = result
+    return result
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("ascii")
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
-    """Create a JWT access token."""
+    """Create a JWT access token.
+    
+    The ``exp`` claim is emitted as an integer timestamp to keep the
+    payload small.
+    """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    if expires_delta is None:
+        expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    to_encode["exp"] = int(time.time() + expires_delta.total_seconds())
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def decode_token(token: str) -> dict:
-    """Decode and verify a JWT token."""
+    """Decode and verify a JWT token.
+    
+    The signature is checked with ``jws.verify``, which accepts only the
+    exact HS256 algorithm, and only the ``exp`` claim is validated, skipping
+    ``jwt.decode``'s generic claim-validation layers. Successfully verified payloads are cached for a
+    short TTL so repeated requests with the same token skip verification.
+    """
+    token_digest = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    with _jwt_cache_lock:
+        cached = _jwt_cache.get(token_digest)
+    if cached is not None and cached.get("exp", 0) > time.time():
+        return cached
+    
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = orjson.loads(jws.verify(token, SECRET_KEY, [ALGORITHM]))
+        if not isinstance(payload, dict):
+            raise JWTError("Invalid payload")
+        exp = payload.get("exp")
+        if not isinstance(exp, int) or exp <= time.time():
+            raise JWTError("Token expired or missing exp claim")
+        with _jwt_cache_lock:
+            _jwt_cache[token_digest] = payload
         return payload
-    except JWTError:
+    except (JOSEError, orjson.JSONDecodeError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
@@ -119,9 +219,16 @@ def decode_token(token: str) -> dict:
 
 
 def authenticate_user(username: str, password: str) -> Optional[dict]:
-    """Authenticate a user with username and password."""
+    """Authenticate a user with username and password.
+    
+    SECURITY: Unknown usernames are checked against a dummy hash so both
+    branches run one bcrypt verification and timing does not reveal
+    whether a username exists.
+    """
     user = DEMO_USERS.get(username)
-    if not user or not verify_password(password, user["hashed_password"]):
+    hashed = user["hashed_password_b"] if user else _DUMMY_HASH
+    password_ok = _verify_password_cached(password, hashed)
+    if not user or not password_ok:
         return None
     return user
 
@@ -129,6 +236,10 @@ def authenticate_user(username: str, password: str) -> Optional[dict]:
 def check_rate_limit(identifier: str, limit: int = 100) -> bool:
     """Check rate limit for an identifier (user or API key).
     
+    Uses an approximate sliding window: the previous and current hourly
+    window counts are blended by how far we are into the current window,
+    so each identifier costs three integers.
+    
     Args:
         identifier: User ID or API key
         limit: Maximum requests per hour
@@ -136,28 +247,34 @@ def check_rate_limit(identifier: str, limit: int = 100) -> bool:
     Returns:
         True if within limit, False otherwise
     """
-    now = datetime.now(timezone.utc)
-    hour_ago = now - timedelta(hours=1)
+    now = int(time.monotonic())
+    window, offset = divmod(now, RATE_LIMIT_WINDOW_SECONDS)
     
-    if identifier not in rate_limit_storage:
-        rate_limit_storage[identifier] = {
-            "requests": [],
-            "count": 0
-        }
+    counters = rate_limit_storage.get(identifier)
+    if counters is None:
+        if len(rate_limit_storage) >= RATE_LIMIT_MAX_TRACKED:
+            rate_limit_storage.popitem(last=False)
+        counters = rate_limit_storage[identifier] = {"prev": 0, "cur": 0, "win": window}
+    else:
+        rate_limit_storage.move_to_end(identifier)
     
-    # Clean old requests
-    user_data = rate_limit_storage[identifier]
-    user_data["requests"] = [
-        req_time for req_time in user_data["requests"]
-        if req_time > hour_ago
-    ]
+    # Roll the fixed windows forward
+    if window > counters["win"] + 1:
+        counters["prev"] = 0
+        counters["cur"] = 0
+        counters["win"] = window
+    elif window == counters["win"] + 1:
+        counters["prev"] = counters["cur"]
+        counters["cur"] = 0
+        counters["win"] = window
     
-    # Check limit
-    if len(user_data["requests"]) >= limit:
+    # Check limit against the weighted count
+    weight = 1.0 - offset / RATE_LIMIT_WINDOW_SECONDS
+    if counters["cur"] + counters["prev"] * weight >= limit:
         return False
     
-    # Add current request
-    user_data["requests"].append(now)
+    # Count the current request
+    counters["cur"] += 1
     return True
 
 
@@ -185,7 +302,11 @@ async def get_current_user_jwt(
                 detail="Rate limit exceeded"
             )
             
-        return User(**user_data)
+        cache_key = ("jwt", username)
+        user = _user_obj_cache.get(cache_key)
+        if user is None:
+            user = _user_obj_cache[cache_key] = User(**user_data)
+        return user
         
     except HTTPException:
         raise
@@ -200,33 +321,51 @@ async def get_current_user_api_key(
     if not api_key:
         return None
         
-    key_data = API_KEYS.get(api_key)
+    # SECURITY: Compare against every stored digest so timing does not reveal
+    # whether or where a key matched
+    key_hash = hashlib.sha256(api_key.encode()).digest()
+    key_data = None
+    for candidate_hash, candidate_data in API_KEY_HASHES.items():
+        if hmac.compare_digest(key_hash, candidate_hash):
+            key_data = candidate_data
     if not key_data or not key_data["is_active"]:
         return None
         
     # Check rate limit
     rate_limit = key_data.get("rate_limit", 100)
-    if not check_rate_limit(api_key, limit=rate_limit):
+    if not check_rate_limit(key_hash.hex(), limit=rate_limit):
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Rate limit exceeded"
         )
         
     # Return a synthetic user for API key auth
-    return User(
-        username=f"api_key_{key_data['name']}",
-        is_active=True,
-        is_admin=False
-    )
+    cache_key = ("api_key", key_data["name"])
+    user = _user_obj_cache.get(cache_key)
+    if user is None:
+        username = f"api_key_{key_data['name']}"
+        user = _user_obj_cache[cache_key] = User(
+            username=username,
+            is_active=True,
+            is_admin=False
+        )
+    return user
 
 
 async def get_current_user(
-    jwt_user: Optional[User] = Depends(get_current_user_jwt),
-    api_key_user: Optional[User] = Depends(get_current_user_api_key)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    api_key: Optional[str] = Depends(api_key_scheme)
 ) -> User:
-    """Get current user from either JWT or API key."""
+    """Get current user from either JWT or API key.
+    
+    The API key is only checked when JWT authentication does not yield a
+    user, so a valid bearer token skips the API-key lookup and its rate
+    limit accounting.
+    """
     # Try JWT first, then API key
-    user = jwt_user or api_key_user
+    user = await get_current_user_jwt(credentials)
+    if user is None:
+        user = await get_current_user_api_key(api_key)
     
     if not user:
         raise HTTPException(
@@ -258,14 +397,20 @@ async def get_admin_user(
 
 # Authentication endpoints to be added to the main app
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
-auth_router = APIRouter(prefix="/api/auth", tags=["authentication"])
+auth_router = APIRouter(
+    prefix="/api/auth",
+    tags=["authentication"],
+    default_response_class=ORJSONResponse,
+)
 
 
 @auth_router.post("/login", response_model=Token)
 async def login(request: LoginRequest):
     """Login with username and password to get JWT token."""
-    user = authenticate_user(request.username, request.password)
+    # bcrypt is CPU-bound; run it off the event loop so concurrent logins overlap
+    user = await asyncio.to_thread(authenticate_user, request.username, request.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
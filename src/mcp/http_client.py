@@ -6,15 +6,59 @@ PDF RAG HTTP API server.
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+import httpx
+import orjson
 import requests
 from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Connection pool sizes for the shared HTTP adapters
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+
+# Shared adapters keyed by (verify_ssl, max_retries) so keep-alive connections
+# are reused across client instances instead of re-handshaking per client
+_adapter_cache: Dict[tuple, HTTPAdapter] = {}
+
+# Connection-specific headers that HTTP/2 forbids; requests adds
+# "Connection: keep-alive" to every session by default
+_HOP_BY_HOP_HEADERS = {"connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"}
+
+
+def _get_shared_adapter(verify_ssl: bool, max_retries: int) -> HTTPAdapter:
+    """Get a pooled HTTP adapter shared by all clients with the same settings.
+
+    Args:
+        verify_ssl: Whether SSL certificates are verified
+        max_retries: Maximum number of retries for failed requests
+
+    Returns:
+        Shared HTTP adapter
+    """
+    key = (verify_ssl, max_retries)
+    adapter = _adapter_cache.get(key)
+    if adapter is None:
+        retry_strategy = Retry(
+            total=max_retries,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"]),
+            backoff_factor=1,
+            raise_on_status=False,
+        )
+        adapter = _adapter_cache[key] = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=retry_strategy,
+        )
+    return adapter
+
 
 class PDFRAGClient:
     """Client for PDF RAG HTTP API."""
@@ -45,17 +89,14 @@ class PDFRAGClient:
         self.api_key = api_key
         self.jwt_token = None
         self.verify_ssl = verify_ssl
+        self.max_retries = max_retries
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._etags: Dict[str, tuple[str, Any]] = {}
         
-        # Setup session with retry strategy
+        # Setup session with the shared, pooled retry adapter
         self.session = requests.Session()
         self.session.verify = verify_ssl
-        retry_strategy = Retry(
-            total=max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            method_whitelist=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE", "POST"],
-            backoff_factor=1,
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = _get_shared_adapter(verify_ssl, max_retries)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
@@ -71,6 +112,42 @@ class PDFRAGClient:
         elif api_key:
             self.session.headers["X-API-Key"] = api_key
 
+    def _get_with_etag(self, path: str) -> Any:
+        """GET a JSON resource, revalidating a cached copy via ETag.
+
+        Sends If-None-Match when a previous response carried an ETag and
+        returns the cached body on 304 Not Modified. Servers that do not
+        emit ETags simply get a plain GET.
+
+        Args:
+            path: API path (e.g. "/api/documents")
+
+        Returns:
+            Decoded JSON body
+
+        Raises:
+            requests.HTTPError: If the request fails
+        """
+        etag, cached = self._etags.get(path, (None, None))
+        headers = {"If-None-Match": etag} if etag else None
+        
+        response = self.session.get(
+            f"{self.base_url}{path}",
+            headers=headers,
+            timeout=self.timeout,
+        )
+        if response.status_code == 304 and etag:
+            return cached
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        new_etag = response.headers.get("ETag")
+        if new_etag:
+            self._etags[path] = (new_etag, data)
+        else:
+            self._etags.pop(path, None)
+        return data
+
     def login(self, username: str, password: str) -> Dict[str, Any]:
         """Login with username and password to get JWT token.
 
@@ -86,14 +163,16 @@ class PDFRAGClient:
         """
         response = self.session.post(
             f"{self.base_url}/api/auth/login",
-            json={"username": username, "password": password},
+            data=orjson.dumps({"username": username, "password": password}),
             timeout=self.timeout,
         )
         response.raise_for_status()
         
-        data = response.json()
+        data = orjson.loads(response.content)
         self.jwt_token = data["access_token"]
         self.session.headers["Authorization"] = f"Bearer {self.jwt_token}"
+        if self._async_client is not None:
+            self._async_client.headers["Authorization"] = f"Bearer {self.jwt_token}"
         
         logger.info(f"Successfully authenticated as {username}")
         return data
@@ -113,12 +192,12 @@ class PDFRAGClient:
         """
         response = self.session.post(
             f"{self.base_url}/api/query",
-            json={"question": question, "top_k": top_k},
+            data=orjson.dumps({"question": question, "top_k": top_k}),
             timeout=self.timeout,
         )
         response.raise_for_status()
         
-        return response.json()
+        return orjson.loads(response.content)
 
     def add_document(self, pdf_path: Union[str, Path], document_type: str = "unknown") -> Dict[str, Any]:
         """Add a PDF document to the knowledge base.
@@ -140,12 +219,12 @@ class PDFRAGClient:
         
         response = self.session.post(
             f"{self.base_url}/api/documents",
-            json={"pdf_path": str(pdf_path.absolute()), "document_type": document_type},
+            data=orjson.dumps({"pdf_path": str(pdf_path.absolute()), "document_type": document_type}),
             timeout=self.timeout,
         )
         response.raise_for_status()
         
-        return response.json()
+        return orjson.loads(response.content)
 
     def add_documents_batch(
         self,
@@ -173,16 +252,54 @@ class PDFRAGClient:
         
         response = self.session.post(
             f"{self.base_url}/api/documents/batch",
-            json={
+            data=orjson.dumps({
                 "folder_path": str(folder_path.absolute()),
                 "document_type": document_type,
                 "recursive": recursive,
-            },
+            }),
             timeout=self.timeout * 10,  # Longer timeout for batch operations
         )
         response.raise_for_status()
         
-        return response.json()
+        return orjson.loads(response.content)
+
+    def add_documents_parallel(
+        self,
+        pdf_paths: List[Union[str, Path]],
+        document_type: str = "unknown",
+        max_workers: int = 8,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Add multiple PDF documents concurrently, one request per document.
+
+        Unlike add_documents_batch, which has the server ingest a folder
+        sequentially, this fans out add_document calls with bounded
+        concurrency so network and server-side parsing overlap.
+
+        Args:
+            pdf_paths: Paths to PDF files
+            document_type: Type for all documents
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            Mapping of each path to its operation response; failed requests
+            map to {"success": False, "message": <error>}
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.add_document, path, document_type): str(path)
+                for path in pdf_paths
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    results[path] = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to add document {path}: {e}")
+                    results[path] = {"success": False, "message": str(e)}
+        
+        return results
 
     def upload_document(
         self,
@@ -206,24 +323,23 @@ class PDFRAGClient:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        # Stream the multipart body from disk instead of building it in memory
         with open(file_path, "rb") as f:
-            files = {"file": (file_path.name, f, "application/pdf")}
-            data = {"document_type": document_type}
-            
-            # Temporarily remove Content-Type header for multipart
-            headers = self.session.headers.copy()
-            headers.pop("Content-Type", None)
+            encoder = MultipartEncoder(fields={
+                "document_type": document_type,
+                "file": (file_path.name, f, "application/pdf"),
+            })
+            headers = {**self.session.headers, "Content-Type": encoder.content_type}
             
             response = self.session.post(
                 f"{self.base_url}/api/documents/upload",
-                files=files,
-                data=data,
+                data=encoder,
                 headers=headers,
                 timeout=self.timeout * 5,  # Longer timeout for uploads
             )
         
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     def list_documents(self) -> List[Dict[str, Any]]:
         """List all documents in the knowledge base.
@@ -234,13 +350,7 @@ class PDFRAGClient:
         Raises:
             requests.HTTPError: If operation fails
         """
-        response = self.session.get(
-            f"{self.base_url}/api/documents",
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-        
-        data = response.json()
+        data = self._get_with_etag("/api/documents")
         return data["documents"]
 
     def get_system_info(self) -> Dict[str, Any]:
@@ -252,13 +362,7 @@ class PDFRAGClient:
         Raises:
             requests.HTTPError: If operation fails
         """
-        response = self.session.get(
-            f"{self.base_url}/api/system/info",
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-        
-        return response.json()
+        return self._get_with_etag("/api/system/info")
 
     def clear_database(self, confirm: bool = False) -> Dict[str, Any]:
         """Clear the vector database.
@@ -278,12 +382,12 @@ class PDFRAGClient:
         
         response = self.session.delete(
             f"{self.base_url}/api/database",
-            json={"confirm": confirm},
+            data=orjson.dumps({"confirm": confirm}),
             timeout=self.timeout,
         )
         response.raise_for_status()
         
-        return response.json()
+        return orjson.loads(response.content)
 
     def health_check(self) -> Dict[str, Any]:
         """Check server health.
@@ -300,12 +404,99 @@ class PDFRAGClient:
         )
         response.raise_for_status()
         
-        return response.json()
+        return orjson.loads(response.content)
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 async client, creating it on first use.
+
+        Returns:
+            Async client multiplexing requests over a pooled connection
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={
+                    name: value
+                    for name, value in self.session.headers.items()
+                    if name.lower() not in _HOP_BY_HOP_HEADERS
+                },
+                timeout=self.timeout,
+                transport=httpx.AsyncHTTPTransport(
+                    http2=True,
+                    verify=self.verify_ssl,
+                    retries=self.max_retries,
+                ),
+            )
+        return self._async_client
+
+    async def aquery(self, question: str, top_k: int = 5) -> Dict[str, Any]:
+        """Query the technical documentation asynchronously.
+
+        Concurrent calls (e.g. via ``asyncio.gather``) share one HTTP/2
+        connection.
+
+        Args:
+            question: Question to search for
+            top_k: Number of relevant chunks to retrieve
+
+        Returns:
+            Query response with answer and sources
+
+        Raises:
+            httpx.HTTPStatusError: If query fails
+        """
+        response = await self._get_async_client().post(
+            "/api/query",
+            content=orjson.dumps({"question": question, "top_k": top_k}),
+        )
+        response.raise_for_status()
+        
+        return orjson.loads(response.content)
+
+    async def aadd_document(
+        self, pdf_path: Union[str, Path], document_type: str = "unknown"
+    ) -> Dict[str, Any]:
+        """Add a PDF document to the knowledge base asynchronously.
+
+        Args:
+            pdf_path: Path to PDF file
+            document_type: Type of document (e.g., 'manual', 'specification')
+
+        Returns:
+            Operation response
+
+        Raises:
+            httpx.HTTPStatusError: If operation fails
+            FileNotFoundError: If PDF file not found
+        """
+        pdf_path = Path(pdf_path)
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        response = await self._get_async_client().post(
+            "/api/documents",
+            content=orjson.dumps({"pdf_path": str(pdf_path.absolute()), "document_type": document_type}),
+        )
+        response.raise_for_status()
+        
+        return orjson.loads(response.content)
 
     def close(self):
-        """Close the client session."""
+        """Close the client session.
+
+        The shared adapters are detached first so their pooled connections
+        stay available to other clients.
+        """
+        self.session.adapters.clear()
         self.session.close()
 
+    async def aclose(self):
+        """Close the client session and the async client, if created."""
+        self.close()
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -314,6 +505,14 @@ class PDFRAGClient:
         """Context manager exit."""
         self.close()
 
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+
 
 # Example usage
 if __name__ == "__main__":
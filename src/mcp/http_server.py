@@ -5,49 +5,202 @@ This module provides an HTTP-based API server that enables
 RAG-powered technical documentation queries through RESTful endpoints.
 """
 
-import asyncio
+import hashlib
 import logging
+import multiprocessing
+import multiprocessing.connection
 import os
+import signal
+import socket
+import stat
+import sys
 import tempfile
+import time
+from collections import Counter, deque
 from contextlib import asynccontextmanager
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import aiofiles.tempfile
+import anyio
+import anyio.to_thread
+import orjson
 import uvicorn
 import yaml
 from fastapi import Depends, FastAPI, File, Form, HTTPException, Request, UploadFile, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field, validator
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict, Field
 
 try:
     # Try relative import (when run as module)
     from ..rag_engine.retrieval import RAGEngine
-    from .auth import get_current_user, User, auth_router
+    from .auth import get_admin_user, get_current_user, User, auth_router
     from .logging_config import configure_mcp_logging, log_system_info
-    from .mcp_http_adapter import MCPHTTPAdapter
+    from .mcp_http_adapter import SEMANTIC_CACHE_THRESHOLD, MCPHTTPAdapter, _iter_pdfs
 except ImportError:
     # Fall back to absolute import (when run directly)
     import sys
     from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
     from src.rag_engine.retrieval import RAGEngine
-    from src.mcp.auth import get_current_user, User, auth_router
+    from src.mcp.auth import get_admin_user, get_current_user, User, auth_router
     from src.mcp.logging_config import configure_mcp_logging, log_system_info
-    from src.mcp.mcp_http_adapter import MCPHTTPAdapter
+    from src.mcp.mcp_http_adapter import SEMANTIC_CACHE_THRESHOLD, MCPHTTPAdapter, _iter_pdfs
 
 # Configure logger with rotation
 logger = configure_mcp_logging(server_type="http", enable_console=True)
 
+# Prefer the LibYAML-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+    logger.warning(
+        "LibYAML not available, using pure-Python YAML loader. "
+        "Install libyaml-dev and reinstall PyYAML for faster config loading."
+    )
+
 # Constants for resource limits
 MAX_FILES_PER_BATCH = 100
 MAX_FILE_SIZE_MB = 50
 MAX_QUERY_LENGTH = 1000
 MAX_TOP_K = 20
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+COMPONENT_STATUS_TTL_SECONDS = 5.0
+RAG_CONCURRENCY = 8  # Max concurrent blocking RAG calls
+WORKER_MAX_RESTARTS = 5  # Worker restarts allowed per window before giving up
+WORKER_RESTART_WINDOW_SECONDS = 60.0
+INGEST_CONCURRENCY = 4  # Max concurrent PDF conversions per batch request
+INGEST_FLUSH_SIZE = 16  # Documents embedded and stored together in a batch
+
+# Features reported by /api/system/info
+SERVER_FEATURES = (
+    "Query technical documentation using RAG",
+    "Add PDF documents to knowledge base",
+    "Upload PDF files via API",
+    "List all documents in the system",
+    "Get system status and configuration",
+    "JWT-based authentication",
+    "CORS support for web clients",
+)
+
+# Event loop and HTTP parser implementations for uvicorn (from uvicorn[standard])
+try:
+    import uvloop  # noqa: F401
+    UVICORN_LOOP = "uvloop"
+except ImportError:
+    UVICORN_LOOP = "auto"
+    logger.warning("uvloop not available, using the default asyncio event loop")
+
+try:
+    import httptools  # noqa: F401
+    UVICORN_HTTP = "httptools"
+except ImportError:
+    UVICORN_HTTP = "auto"
+    logger.warning("httptools not available, using the pure-Python HTTP parser")
+
+
+def _load_yaml_cached(path: Path) -> Any:
+    """Load a YAML file, reusing a JSON sidecar cache keyed by its mtime.
+
+    Parsing YAML is much slower than JSON, and every uvicorn worker loads
+    the same config files on startup. The parsed result is written next to
+    the YAML file as ``<name>.<mtime_ns>.json`` and reused until the YAML
+    file changes.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content
+    """
+    mtime_ns = path.stat().st_mtime_ns
+    cache_path = path.with_name(f"{path.name}.{mtime_ns}.json")
+    if cache_path.exists():
+        try:
+            return orjson.loads(cache_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable config cache {cache_path.name}: {e}")
+
+    with open(path) as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    try:
+        # Drop caches for previous versions of this file
+        for stale in path.parent.glob(f"{path.name}.*.json"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+        cache_path.write_bytes(orjson.dumps(data))
+    except (OSError, TypeError) as e:
+        # Read-only config dir or non-JSON-serializable YAML; caching is optional
+        logger.debug(f"Could not write config cache {cache_path.name}: {e}")
+
+    return data
+
+
+def _preflight_file(path: Path) -> tuple[bool, bool, float]:
+    """Check a document path with a single stat call.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        Tuple of (exists, has .pdf suffix, size in MB)
+    """
+    is_pdf = path.suffix.lower() == ".pdf"
+    try:
+        st = path.stat()
+    except OSError:
+        return False, is_pdf, 0.0
+    return True, is_pdf, st.st_size / (1024 * 1024)
+
+
+def _preflight_folder(path: Path) -> tuple[bool, bool]:
+    """Check a folder path with a single stat call.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        Tuple of (exists, is a directory)
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return False, False
+    return True, stat.S_ISDIR(st.st_mode)
+
+
+def _etag_response(request: Request, content: Any) -> Response:
+    """Build a JSON response with an ETag, or 304 if the client's copy is current.
+
+    Args:
+        request: Incoming request, checked for If-None-Match
+        content: JSON-serializable response body
+
+    Returns:
+        200 response carrying the body and its ETag, or an empty 304
+    """
+    body = orjson.dumps(content)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    # Responses depend on the caller's credentials; make clients revalidate
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 class QueryRequest(BaseModel):
     """Request model for document queries."""
+    model_config = ConfigDict(str_strip_whitespace=True)
+
     question: str = Field(..., description="Question to search for in the PDF knowledge base", max_length=MAX_QUERY_LENGTH)
     top_k: int = Field(5, description="Number of relevant chunks to retrieve", ge=1, le=MAX_TOP_K)
 
@@ -98,6 +251,12 @@ class SystemInfoResponse(BaseModel):
     features: List[str]
 
 
+class MetricsResponse(BaseModel):
+    """Response model for request metrics."""
+    requests: Dict[str, Dict[str, int]]
+    total: int
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
     status: str
@@ -114,7 +273,14 @@ class PDFRAGHTTPServer:
         self._project_root = Path(__file__).parent.parent.parent
         self.rag_engine = None
         self.mcp_adapter = None
-        self.config = self._load_config()
+        # Caps concurrent blocking RAG calls, created in the app lifespan
+        self.rag_limiter: Optional[anyio.CapacityLimiter] = None
+        # Request counts keyed by (endpoint, username); plain increments under the GIL
+        self.request_counts: Counter = Counter()
+        # Static system info, built once the RAG engine is up
+        self.sysinfo_static: Dict[str, Any] = {}
+        # (monotonic timestamp, results) of the last component test
+        self._component_status_cache: tuple[float, Optional[Dict[str, bool]]] = (0.0, None)
         
         # SECURITY: Define allowed base directories for file operations
         default_doc_dir = Path.home() / ".pdf_rag" / "documents"
@@ -126,35 +292,58 @@ class PDFRAGHTTPServer:
         # Create allowed directories if they don't exist
         for dir_path in self._allowed_dirs:
             dir_path.mkdir(parents=True, exist_ok=True)
+        
+        # Precomputed for checks in _validate_path
+        self._allowed_resolved_set = frozenset(self._allowed_dirs)
+        self._allowed_dir_strs = frozenset(str(p) for p in self._allowed_dirs)
+        self._allowed_prefixes = tuple(os.path.join(str(p), "") for p in self._allowed_dirs)
 
-    def _load_config(self) -> dict[str, Any]:
-        """Load configuration from files.
+    @cached_property
+    def config(self) -> dict[str, Any]:
+        """Merged RAG and HTTP server configuration.
 
         Returns:
             Configuration dictionary
         """
         config = {}
+        config.update(self.rag_config)
+        config.update(self.http_config)
+        return config
+
+    @cached_property
+    def rag_config(self) -> dict[str, Any]:
+        """RAG configuration, loaded on first access.
+
+        Returns:
+            RAG configuration dictionary
+        """
+        return self._load_rag_config()
+
+    @cached_property
+    def http_config(self) -> dict[str, Any]:
+        """HTTP server configuration, loaded on first access.
+
+        Returns:
+            HTTP server configuration dictionary
+        """
+        return self._load_http_config()
+
+    def _load_rag_config(self) -> dict[str, Any]:
+        """Load RAG configuration from file and environment.
+
+        Returns:
+            RAG configuration dictionary
+        """
+        config = {}
 
-        # Load RAG config
         rag_config_path = self._project_root / "config" / "rag_config.yaml"
         if rag_config_path.exists():
             try:
-                with open(rag_config_path) as f:
-                    config.update(yaml.safe_load(f))
+                config.update(_load_yaml_cached(rag_config_path))
                 logger.info("Loaded RAG configuration")
             except Exception as e:
                 logger.error(f"Failed to load RAG config: {e}")
 
-        # Load HTTP server config
-        http_config_path = self._project_root / "config" / "http_server_config.yaml"
-        if http_config_path.exists():
-            try:
-                with open(http_config_path) as f:
-                    config.update(yaml.safe_load(f))
-                logger.info("Loaded HTTP server configuration")
-            except Exception as e:
-                logger.error(f"Failed to load HTTP server config: {e}")
-
         # Override with environment variables if set
         if os.environ.get("LLM_TYPE"):
             config.setdefault("llm", {})["type"] = os.environ["LLM_TYPE"]
@@ -170,6 +359,24 @@ class PDFRAGHTTPServer:
 
         return config
 
+    def _load_http_config(self) -> dict[str, Any]:
+        """Load HTTP server configuration from file.
+
+        Returns:
+            HTTP server configuration dictionary
+        """
+        config = {}
+
+        http_config_path = self._project_root / "config" / "http_server_config.yaml"
+        if http_config_path.exists():
+            try:
+                config.update(_load_yaml_cached(http_config_path))
+                logger.info("Loaded HTTP server configuration")
+            except Exception as e:
+                logger.error(f"Failed to load HTTP server config: {e}")
+
+        return config
+
     def _validate_path(self, path: Path) -> Path:
         """Validate that a path is within allowed directories.
         
@@ -182,30 +389,31 @@ class PDFRAGHTTPServer:
         Raises:
             HTTPException: If path is not allowed
         """
+        # Allowed roots are stored resolved, so they can be returned as-is
+        if path in self._allowed_resolved_set:
+            return path
+
         try:
             # Resolve to absolute path
             resolved_path = path.resolve()
-            
-            # Check if path is within any allowed directory
-            for allowed_dir in self._allowed_dirs:
-                try:
-                    resolved_path.relative_to(allowed_dir)
-                    return resolved_path
-                except ValueError:
-                    continue
-                    
-            # Path is not in any allowed directory
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Access to this path is not allowed"
-            )
-        except Exception as e:
+        except (OSError, RuntimeError, ValueError) as e:
             logger.error(f"Path validation error: {e}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid path"
             )
 
+        # Check if path is within any allowed directory
+        path_str = str(resolved_path)
+        if path_str in self._allowed_dir_strs or path_str.startswith(self._allowed_prefixes):
+            return resolved_path
+
+        # Path is not in any allowed directory
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access to this path is not allowed"
+        )
+
     async def initialize_rag_engine(self):
         """Initialize the RAG engine."""
         if self.rag_engine:
@@ -216,34 +424,77 @@ class PDFRAGHTTPServer:
 
             # Prepare configuration
             rag_config = {
-                "llm_type": self.config.get("llm", {}).get("type", "openai"),
-                "llm_model": self.config.get("llm", {}).get("model", "gpt-4"),
-                "embedding_model": self.config.get("embedding", {}).get(
+                "llm_type": self.rag_config.get("llm", {}).get("type", "openai"),
+                "llm_model": self.rag_config.get("llm", {}).get("model", "gpt-4"),
+                "embedding_model": self.rag_config.get("embedding", {}).get(
                     "model", "sentence-transformers/all-MiniLM-L6-v2"
                 ),
-                "vector_db_path": self.config.get("vector_store", {}).get(
+                "embedding_batch_size": self.rag_config.get("embedding", {}).get("batch_size", 64),
+                "embedding_precision": self.rag_config.get("embedding", {}).get("precision", "fp32"),
+                "vector_db_path": self.rag_config.get("vector_store", {}).get(
                     "path", "./data/vector_db"
                 ),
-                "collection_name": self.config.get("vector_store", {}).get(
+                "collection_name": self.rag_config.get("vector_store", {}).get(
                     "collection_name", "technical_docs"
                 ),
-                "chunk_size": self.config.get("chunking", {}).get("max_tokens", 512),
-                "chunk_overlap": self.config.get("chunking", {}).get("overlap_tokens", 50),
+                "chunk_size": self.rag_config.get("chunking", {}).get("max_tokens", 512),
+                "chunk_overlap": self.rag_config.get("chunking", {}).get("overlap_tokens", 50),
             }
 
             self.rag_engine = RAGEngine(rag_config)
             logger.info("RAG engine initialized successfully")
             
             # Initialize MCP adapter
-            self.mcp_adapter = MCPHTTPAdapter(self.rag_engine)
+            answer_cache_config = self.http_config.get("http_server", {}).get("mcp_answer_cache", {})
+            self.mcp_adapter = MCPHTTPAdapter(
+                self.rag_engine,
+                semantic_cache=answer_cache_config.get("semantic", False),
+                semantic_cache_threshold=answer_cache_config.get(
+                    "semantic_threshold", SEMANTIC_CACHE_THRESHOLD
+                ),
+            )
             logger.info("MCP HTTP adapter initialized successfully")
 
+            # System info parts that don't change while the server runs
+            self.sysinfo_static = {
+                "server_version": "1.0.0",
+                "configuration": {
+                    "llm_type": self.rag_config.get("llm", {}).get("type", "unknown"),
+                    "llm_model": self.rag_config.get("llm", {}).get("model", "unknown"),
+                    "embedding_model": self.rag_config.get("embedding", {}).get("model", "unknown"),
+                    "collection_name": self.rag_config.get("vector_store", {}).get(
+                        "collection_name", "unknown"
+                    ),
+                },
+                "features": SERVER_FEATURES,
+            }
+
         except Exception as e:
             logger.error(f"Failed to initialize RAG engine: {e}")
             self.rag_engine = None
             self.mcp_adapter = None
             raise
 
+    def get_component_status(self) -> dict[str, bool]:
+        """Get RAG component test results, reusing them for a few seconds.
+
+        Returns:
+            Dictionary with test results for each component
+        """
+        cached_at, cached_results = self._component_status_cache
+        now = time.monotonic()
+        if cached_results is not None and now - cached_at < COMPONENT_STATUS_TTL_SECONDS:
+            return cached_results
+
+        results = self.rag_engine.test_components()
+        self._component_status_cache = (now, results)
+        return results
+
+    def invalidate_answer_caches(self) -> None:
+        """Drop MCP answers cached before the knowledge base changed."""
+        if self.mcp_adapter:
+            self.mcp_adapter.invalidate_answer_caches()
+
 
 # Create server instance
 server = PDFRAGHTTPServer()
@@ -255,6 +506,9 @@ async def lifespan(app: FastAPI):
     # Startup
     log_system_info(logger)
     logger.info("Starting PDF RAG HTTP Server...")
+    server.rag_limiter = anyio.CapacityLimiter(
+        server.http_config.get("http_server", {}).get("rag_concurrency", RAG_CONCURRENCY)
+    )
     await server.initialize_rag_engine()
     yield
     # Shutdown
@@ -267,12 +521,13 @@ app = FastAPI(
     description="HTTP API for PDF RAG-powered technical documentation queries",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=server.config.get("http_server", {}).get("cors_origins", ["*"]),
+    allow_origins=server.http_config.get("http_server", {}).get("cors_origins", ["*"]),
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -281,19 +536,51 @@ app.add_middleware(
 # Include authentication router
 app.include_router(auth_router)
 
+# Cached health response: (monotonic timestamp, rag engine ready, response)
+HEALTH_CACHE_TTL_SECONDS = 1.0
+_health_cache: tuple[float, bool, Optional[Dict[str, Any]]] = (0.0, False, None)
 
-@app.get("/api/health", response_model=HealthResponse)
+
+@app.get("/api/health", response_model=None, responses={200: {"model": HealthResponse}})
 async def health_check():
-    """Health check endpoint."""
+    """Health check endpoint.
+    
+    The response is reused for HEALTH_CACHE_TTL_SECONDS, or until the RAG
+    engine comes up or goes away, since load balancers poll it frequently.
+    """
+    global _health_cache
+    now = time.monotonic()
+    rag_ready = server.rag_engine is not None
+    cached_at, cached_ready, cached_response = _health_cache
+    if cached_response is not None and cached_ready == rag_ready and now - cached_at < HEALTH_CACHE_TTL_SECONDS:
+        return ORJSONResponse(content=cached_response)
+
     components = {
-        "rag_engine": server.rag_engine is not None,
+        "rag_engine": rag_ready,
         "configuration": bool(server.config),
     }
     
-    return HealthResponse(
-        status="healthy" if all(components.values()) else "degraded",
-        version="1.0.0",
-        components=components
+    response = {
+        "status": "healthy" if all(components.values()) else "degraded",
+        "version": "1.0.0",
+        "components": components,
+    }
+    _health_cache = (now, rag_ready, response)
+    return ORJSONResponse(content=response)
+
+
+@app.get("/api/metrics", response_model=MetricsResponse)
+async def get_metrics(
+    current_user: User = Depends(get_admin_user)
+):
+    """Get per-endpoint, per-user request counts for this worker (admin only)."""
+    requests: Dict[str, Dict[str, int]] = {}
+    for (endpoint, username), count in list(server.request_counts.items()):
+        requests.setdefault(endpoint, {})[username] = count
+
+    return MetricsResponse(
+        requests=requests,
+        total=sum(server.request_counts.values())
     )
 
 
@@ -322,13 +609,34 @@ async def mcp_sse_endpoint(request: Request):
     return await server.mcp_adapter.handle_sse_request(request)
 
 
-@app.post("/api/query", response_model=QueryResponse)
+@app.get("/mcp/documents")
+async def mcp_documents_stream_endpoint(
+    current_user: User = Depends(get_current_user)
+):
+    """Stream the MCP document list as markdown."""
+    server.request_counts[("list_documents_stream", current_user.username)] += 1
+    logger.info("Document stream request from user %s", current_user.username)
+
+    if not server.mcp_adapter:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="MCP adapter not available"
+        )
+    
+    return await server.mcp_adapter.handle_documents_stream()
+
+
+@app.post("/api/query", response_model=None, responses={200: {"model": QueryResponse}})
 async def query_documents(
     request: QueryRequest,
     current_user: User = Depends(get_current_user)
 ):
     """Query technical documentation."""
-    logger.info(f"Query request from user {current_user.username} - Question length: {len(request.question)}, top_k: {request.top_k}")
+    server.request_counts[("query", current_user.username)] += 1
+    logger.info(
+        "Query request from user %s - Question length: %d, top_k: %d",
+        current_user.username, len(request.question), request.top_k
+    )
 
     if not server.rag_engine:
         raise HTTPException(
@@ -338,20 +646,22 @@ async def query_documents(
 
     try:
         # Get RAG response
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None, server.rag_engine.query, request.question, request.top_k
+        response = await anyio.to_thread.run_sync(
+            server.rag_engine.query, request.question, request.top_k, limiter=server.rag_limiter
         )
         
-        logger.info(f"Query completed - Confidence: {response.confidence:.2f}, Sources: {len(response.sources)}")
-
-        return QueryResponse(
-            answer=response.answer,
-            sources=response.sources,
-            confidence=response.confidence,
-            processing_time=response.processing_time
+        logger.info(
+            "Query completed - Confidence: %.2f, Sources: %d",
+            response.confidence, len(response.sources)
         )
 
+        return ORJSONResponse(content={
+            "answer": response.answer,
+            "sources": response.sources,
+            "confidence": response.confidence,
+            "processing_time": response.processing_time,
+        })
+
     except Exception as e:
         logger.error(f"Query failed: {e}")
         raise HTTPException(
@@ -366,7 +676,11 @@ async def add_document(
     current_user: User = Depends(get_current_user)
 ):
     """Add a single PDF document to the knowledge base."""
-    logger.info(f"Add document request from user {current_user.username} - Type: {request.document_type}")
+    server.request_counts[("add_document", current_user.username)] += 1
+    logger.info(
+        "Add document request from user %s - Type: %s",
+        current_user.username, request.document_type
+    )
 
     if not server.rag_engine:
         raise HTTPException(
@@ -385,20 +699,22 @@ async def add_document(
             detail="Invalid file path"
         )
 
-    if not pdf_path.exists():
+    # Filesystem checks run off the event loop so slow storage doesn't stall it
+    exists, is_pdf, file_size_mb = await anyio.to_thread.run_sync(_preflight_file, pdf_path)
+
+    if not exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="PDF file not found"
         )
 
-    if not pdf_path.suffix.lower() == ".pdf":
+    if not is_pdf:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Not a PDF file"
         )
 
     # Check file size
-    file_size_mb = pdf_path.stat().st_size / (1024 * 1024)
     if file_size_mb > MAX_FILE_SIZE_MB:
         raise HTTPException(
             status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
@@ -406,11 +722,13 @@ async def add_document(
         )
 
     try:
-        # Add document using executor
-        loop = asyncio.get_event_loop()
-        success = await loop.run_in_executor(
-            None, server.rag_engine.add_pdf_document, pdf_path, request.document_type
-        )
+        # Add document in a worker thread
+        try:
+            success = await anyio.to_thread.run_sync(
+                server.rag_engine.add_pdf_document, pdf_path, request.document_type, limiter=server.rag_limiter
+            )
+        finally:
+            server.invalidate_answer_caches()
 
         if success:
             logger.info(f"Successfully added document: {pdf_path.name}")
@@ -439,7 +757,8 @@ async def add_documents_batch(
     current_user: User = Depends(get_current_user)
 ):
     """Add multiple PDF documents from a folder to the knowledge base."""
-    logger.info(f"Add documents batch request from user {current_user.username}")
+    server.request_counts[("add_documents_batch", current_user.username)] += 1
+    logger.info("Add documents batch request from user %s", current_user.username)
 
     if not server.rag_engine:
         raise HTTPException(
@@ -458,23 +777,25 @@ async def add_documents_batch(
             detail="Invalid folder path"
         )
 
-    if not folder_path.exists():
+    # Filesystem checks run off the event loop so slow storage doesn't stall it
+    exists, is_dir = await anyio.to_thread.run_sync(_preflight_folder, folder_path)
+
+    if not exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Folder not found"
         )
 
-    if not folder_path.is_dir():
+    if not is_dir:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Not a directory"
         )
 
     # Find all PDF files
-    if request.recursive:
-        pdf_files = list(folder_path.rglob("*.pdf"))
-    else:
-        pdf_files = list(folder_path.glob("*.pdf"))
+    pdf_files = await anyio.to_thread.run_sync(
+        lambda: list(_iter_pdfs(folder_path, request.recursive))
+    )
 
     if not pdf_files:
         raise HTTPException(
@@ -492,27 +813,66 @@ async def add_documents_batch(
     success_count = 0
     failed_files = []
 
-    for pdf_file in pdf_files:
+    to_add = []
+    for entry in pdf_files:
         try:
-            # Check file size
-            file_size_mb = pdf_file.stat().st_size / (1024 * 1024)
-            if file_size_mb > MAX_FILE_SIZE_MB:
-                failed_files.append(pdf_file.name)
-                continue
-
-            # Add document
-            loop = asyncio.get_event_loop()
-            success = await loop.run_in_executor(
-                None, server.rag_engine.add_pdf_document, pdf_file, request.document_type
-            )
+            # Check file size (DirEntry caches the stat result)
+            file_size_mb = entry.stat().st_size / (1024 * 1024)
+        except OSError as e:
+            logger.error(f"Failed to stat document {entry.name}: {e}")
+            failed_files.append(entry.name)
+            continue
+        if file_size_mb > MAX_FILE_SIZE_MB:
+            failed_files.append(entry.name)
+            continue
+        to_add.append(Path(entry.path))
+
+    # Convert PDFs concurrently, then embed and store each group of
+    # documents together; flushing per group keeps at most one group's
+    # chunks in memory
+    ingest_config = server.http_config.get("http_server", {})
+    convert_limiter = anyio.CapacityLimiter(
+        ingest_config.get("ingest_concurrency", INGEST_CONCURRENCY)
+    )
+    flush_size = ingest_config.get("ingest_flush_size", INGEST_FLUSH_SIZE)
+    results = []
 
-            if success:
-                success_count += 1
-            else:
-                failed_files.append(pdf_file.name)
+    async def prepare(group: List[Path], prepared: list, index: int) -> None:
+        prepared[index] = await anyio.to_thread.run_sync(
+            server.rag_engine.prepare_pdf_document, group[index], request.document_type,
+            limiter=convert_limiter,
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to add document {pdf_file.name}: {e}")
+    try:
+        for start in range(0, len(to_add), flush_size):
+            group = to_add[start:start + flush_size]
+            prepared = [None] * len(group)
+            async with anyio.create_task_group() as tg:
+                for index in range(len(group)):
+                    tg.start_soon(prepare, group, prepared, index)
+
+            ready = [index for index, chunks in enumerate(prepared) if chunks]
+            stored = [False] * len(group)
+            if ready:
+                try:
+                    added = await anyio.to_thread.run_sync(
+                        server.rag_engine.add_document_chunks,
+                        [prepared[index] for index in ready],
+                        limiter=server.rag_limiter,
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to add document batch: {e}")
+                    added = [False] * len(ready)
+                for index, success in zip(ready, added):
+                    stored[index] = success
+            results.extend(stored)
+    finally:
+        server.invalidate_answer_caches()
+
+    for pdf_file, success in zip(to_add, results):
+        if success:
+            success_count += 1
+        else:
             failed_files.append(pdf_file.name)
 
     message = f"Processed {len(pdf_files)} files. Successfully added: {success_count}, Failed: {len(failed_files)}"
@@ -534,7 +894,11 @@ async def upload_document(
     current_user: User = Depends(get_current_user)
 ):
     """Upload and add a PDF document to the knowledge base."""
-    logger.info(f"Upload document request from user {current_user.username} - File: {file.filename}, Type: {document_type}")
+    server.request_counts[("upload_document", current_user.username)] += 1
+    logger.info(
+        "Upload document request from user %s - File: %s, Type: %s",
+        current_user.username, file.filename, document_type
+    )
 
     if not server.rag_engine:
         raise HTTPException(
@@ -548,35 +912,36 @@ async def upload_document(
             detail="Only PDF files are allowed"
         )
 
-    # Check file size
-    file.file.seek(0, 2)  # Seek to end
-    file_size = file.file.tell()
-    file.file.seek(0)  # Reset to beginning
-    
-    file_size_mb = file_size / (1024 * 1024)
-    if file_size_mb > MAX_FILE_SIZE_MB:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"File too large (max {MAX_FILE_SIZE_MB}MB)"
-        )
-
     # SECURITY: Create secure temporary file
+    temp_path = None
     try:
         # Use secure temporary file creation
-        with tempfile.NamedTemporaryFile(
+        async with aiofiles.tempfile.NamedTemporaryFile(
+            "wb",
             suffix=".pdf",
             delete=False,
             dir=server._allowed_dirs[1]  # Use temp directory
         ) as tmp_file:
             temp_path = Path(tmp_file.name)
-            content = await file.read()
-            tmp_file.write(content)
+            # Copy in chunks, counting bytes so oversized uploads stop early.
+            # Writes go through aiofiles so disk I/O doesn't block the event loop.
+            file_size = 0
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > MAX_FILE_SIZE_MB * 1024 * 1024:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"File too large (max {MAX_FILE_SIZE_MB}MB)"
+                    )
+                await tmp_file.write(chunk)
 
         # Add document
-        loop = asyncio.get_event_loop()
-        success = await loop.run_in_executor(
-            None, server.rag_engine.add_pdf_document, temp_path, document_type
-        )
+        try:
+            success = await anyio.to_thread.run_sync(
+                server.rag_engine.add_pdf_document, temp_path, document_type, limiter=server.rag_limiter
+            )
+        finally:
+            server.invalidate_answer_caches()
 
         if success:
             logger.info(f"Successfully added uploaded document: {file.filename}")
@@ -591,6 +956,8 @@ async def upload_document(
                 success=False
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to process uploaded document: {e}")
         raise HTTPException(
@@ -599,16 +966,18 @@ async def upload_document(
         )
     finally:
         # Clean up temporary file
-        if temp_path.exists():
+        if temp_path and temp_path.exists():
             temp_path.unlink()
 
 
-@app.get("/api/documents", response_model=DocumentListResponse)
+@app.get("/api/documents", response_model=None, responses={200: {"model": DocumentListResponse}})
 async def list_documents(
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
     """List all documents in the knowledge base."""
-    logger.info(f"List documents request from user {current_user.username}")
+    server.request_counts[("list_documents", current_user.username)] += 1
+    logger.info("List documents request from user %s", current_user.username)
 
     if not server.rag_engine:
         raise HTTPException(
@@ -618,14 +987,15 @@ async def list_documents(
 
     try:
         # Get documents list
-        loop = asyncio.get_event_loop()
-        documents = await loop.run_in_executor(None, server.rag_engine.list_documents)
-
-        return DocumentListResponse(
-            documents=documents,
-            total_count=len(documents)
+        documents = await anyio.to_thread.run_sync(
+            server.rag_engine.list_documents, limiter=server.rag_limiter
         )
 
+        return _etag_response(request, {
+            "documents": documents,
+            "total_count": len(documents),
+        })
+
     except Exception as e:
         logger.error(f"Failed to list documents: {e}")
         raise HTTPException(
@@ -634,12 +1004,14 @@ async def list_documents(
         )
 
 
-@app.get("/api/system/info", response_model=SystemInfoResponse)
+@app.get("/api/system/info", response_model=None, responses={200: {"model": SystemInfoResponse}})
 async def get_system_info(
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
     """Get system information and component status."""
-    logger.info(f"System info request from user {current_user.username}")
+    server.request_counts[("system_info", current_user.username)] += 1
+    logger.info("System info request from user %s", current_user.username)
 
     if not server.rag_engine:
         raise HTTPException(
@@ -648,32 +1020,16 @@ async def get_system_info(
         )
 
     try:
-        # Get system info
-        system_info = server.rag_engine.get_system_info()
-        test_results = server.rag_engine.test_components()
-
-        # Format configuration
-        config_info = {
-            "llm_type": server.config.get("llm", {}).get("type", "unknown"),
-            "llm_model": server.config.get("llm", {}).get("model", "unknown"),
-            "embedding_model": server.config.get("embedding", {}).get("model", "unknown"),
-            "collection_name": server.config.get("vector_store", {}).get("collection_name", "unknown"),
-        }
-
-        return SystemInfoResponse(
-            server_version="1.0.0",
+        # Component tests may hit the LLM backend; run them off the event loop
+        test_results = await anyio.to_thread.run_sync(
+            server.get_component_status, limiter=server.rag_limiter
+        )
+
+        system_info = SystemInfoResponse(
+            **server.sysinfo_static,
             components_status=test_results,
-            configuration=config_info,
-            features=[
-                "Query technical documentation using RAG",
-                "Add PDF documents to knowledge base",
-                "Upload PDF files via API",
-                "List all documents in the system",
-                "Get system status and configuration",
-                "JWT-based authentication",
-                "CORS support for web clients"
-            ]
         )
+        return _etag_response(request, system_info.model_dump(mode="json"))
 
     except Exception as e:
         logger.error(f"Failed to get system info: {e}")
@@ -689,7 +1045,8 @@ async def clear_database(
     current_user: User = Depends(get_current_user)
 ):
     """Clear the vector database."""
-    logger.info(f"Clear database request from user {current_user.username}")
+    server.request_counts[("clear_database", current_user.username)] += 1
+    logger.info("Clear database request from user %s", current_user.username)
 
     if not request.confirm:
         raise HTTPException(
@@ -705,10 +1062,9 @@ async def clear_database(
 
     try:
         # Get current document count
-        loop = asyncio.get_event_loop()
-        documents = await loop.run_in_executor(None, server.rag_engine.list_documents)
-        doc_count = len(documents)
-        total_chunks = sum(doc["chunk_count"] for doc in documents)
+        doc_count, total_chunks = await anyio.to_thread.run_sync(
+            server.rag_engine.count_documents, limiter=server.rag_limiter
+        )
 
         if doc_count == 0:
             return DocumentResponse(
@@ -718,9 +1074,12 @@ async def clear_database(
 
         # Clear the database
         logger.info(f"Clearing database with {doc_count} documents and {total_chunks} chunks")
-        success = await loop.run_in_executor(
-            None, server.rag_engine.vector_store.clear_collection
-        )
+        try:
+            success = await anyio.to_thread.run_sync(
+                server.rag_engine.vector_store.clear_collection, limiter=server.rag_limiter
+            )
+        finally:
+            server.invalidate_answer_caches()
 
         if success:
             return DocumentResponse(
@@ -741,20 +1100,116 @@ async def clear_database(
         )
 
 
+def _run_reuseport_worker(host: str, port: int) -> None:
+    """Serve the app in one worker process from its own SO_REUSEPORT socket.
+
+    Args:
+        host: Host to bind
+        port: Port to bind
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+
+    # Serve this process's app object; an import string would import the
+    # module a second time and configure logging twice
+    config = uvicorn.Config(
+        app,
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP,
+        log_config=None  # Use our custom logging
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def _run_reuseport_workers(host: str, port: int, workers: int) -> int:
+    """Run worker processes that each own an SO_REUSEPORT listen socket.
+
+    The kernel balances new connections across the per-process accept
+    queues, instead of every worker waking on one shared socket. Workers
+    that exit are restarted; if they keep failing (e.g. the port is taken
+    or the RAG engine can't start), the server stops.
+
+    Args:
+        host: Host to bind
+        port: Port to bind
+        workers: Number of worker processes
+
+    Returns:
+        Exit code: 0 after a clean shutdown, otherwise the exit code of
+        the last worker to fail
+    """
+    ctx = multiprocessing.get_context("spawn")
+    running: Dict[int, multiprocessing.process.BaseProcess] = {}
+    # Monotonic times of recent restarts, oldest first
+    restarts: deque[float] = deque()
+
+    def start_worker(index: int) -> None:
+        process = ctx.Process(
+            target=_run_reuseport_worker, args=(host, port), name=f"http-worker-{index}"
+        )
+        process.start()
+        running[index] = process
+
+    # Turn SIGTERM into SystemExit so the workers are stopped below
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    logger.info(f"Starting {workers} SO_REUSEPORT workers on {host}:{port}")
+    try:
+        for index in range(workers):
+            start_worker(index)
+
+        while True:
+            sentinels = {process.sentinel: index for index, process in running.items()}
+            for sentinel in multiprocessing.connection.wait(list(sentinels)):
+                index = sentinels[sentinel]
+                process = running.pop(index)
+                process.join()
+
+                now = time.monotonic()
+                while restarts and now - restarts[0] > WORKER_RESTART_WINDOW_SECONDS:
+                    restarts.popleft()
+                if len(restarts) >= WORKER_MAX_RESTARTS:
+                    logger.error(
+                        f"{process.name} exited with code {process.exitcode}; workers "
+                        f"restarted {len(restarts)} times in "
+                        f"{WORKER_RESTART_WINDOW_SECONDS:.0f}s, stopping server"
+                    )
+                    # Negative exit codes mean the worker was killed by a signal
+                    return process.exitcode if process.exitcode and process.exitcode > 0 else 1
+
+                logger.warning(f"{process.name} exited with code {process.exitcode}; restarting")
+                restarts.append(now)
+                start_worker(index)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        for process in running.values():
+            if process.is_alive():
+                process.terminate()
+        for process in running.values():
+            process.join()
+
+
 def main():
     """Main entry point for HTTP server."""
     # Get server configuration
-    host = server.config.get("http_server", {}).get("host", "0.0.0.0")
-    port = server.config.get("http_server", {}).get("port", 8000)
-    workers = server.config.get("http_server", {}).get("workers", 1)
+    host = server.http_config.get("http_server", {}).get("host", "0.0.0.0")
+    port = server.http_config.get("http_server", {}).get("port", 8000)
+    workers = server.http_config.get("http_server", {}).get("workers", 1)
     
     # Run server
-    if workers > 1:
+    if workers > 1 and hasattr(socket, "SO_REUSEPORT"):
+        sys.exit(_run_reuseport_workers(host, port, workers))
+    elif workers > 1:
         uvicorn.run(
             "src.mcp.http_server:app",
             host=host,
             port=port,
             workers=workers,
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP,
             log_config=None  # Use our custom logging
         )
     else:
@@ -762,6 +1217,8 @@ def main():
             app,
             host=host,
             port=port,
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP,
             log_config=None  # Use our custom logging
         )
 
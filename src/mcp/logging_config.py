@@ -4,22 +4,91 @@ This module provides rotating log handlers and structured logging setup
 for the MCP servers to enable log retention and analysis.
 """
 
-import json
+import atexit
+import copy
+import functools
 import logging
 import logging.handlers
 import os
+import queue
 import re
+import stat
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+import orjson
 import yaml
 
+# Prefer the LibYAML-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Constants for validation
 MIN_LOG_SIZE = 1024  # 1KB minimum
 MAX_LOG_SIZE = 1024 * 1024 * 1024  # 1GB maximum
 MIN_BACKUP_COUNT = 0
 MAX_BACKUP_COUNT = 100
 VALID_LOG_LEVELS = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+# Translation table escaping newlines and carriage returns and deleting all
+# other C0/C1 control characters, so sanitizing is a single pass
+_CONTROL_CHAR_TABLE = {
+    c: None for c in (*range(0x00, 0x20), *range(0x7f, 0xa0))
+}
+_CONTROL_CHAR_TABLE[0x0a] = '\\n'
+_CONTROL_CHAR_TABLE[0x0d] = '\\r'
+_FILENAME_SANITIZE_RE = re.compile(r'[^\w\-_\.]')
+
+# Get project root safely (resolved once at import)
+try:
+    _PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+except Exception:
+    _PROJECT_ROOT = Path.cwd()
+
+# Allowed log directory locations; only a specific subdirectory of /tmp
+_SAFE_TMP = Path("/tmp") / "pdf_extractor_logs"
+_HOME_CACHE = Path.home() / ".cache" / "pdf_extractor"
+_ALLOWED_LOG_DIRS = (_PROJECT_ROOT, _SAFE_TMP, _HOME_CACHE)
+# Resolved, separator-terminated prefixes for fast containment checks
+_ALLOWED_LOG_PREFIXES = tuple(
+    os.path.join(str(p.resolve(strict=False)), "") for p in _ALLOWED_LOG_DIRS
+)
+
+
+# Built-in defaults; values from config/logging_config.yaml are merged on top
+_DEFAULT_LOGGING_CONFIG: Dict[str, Any] = {
+    "logging": {
+        "level": "INFO",
+        "log_dir": "logs",
+        "rotation": {
+            "max_bytes": 10485760,
+            "backup_count": 5
+        },
+        "console": {
+            "enabled": True,
+            "level": "INFO"
+        },
+        "format": {
+            "include_location": True,
+            "timestamp_format": "%Y-%m-%d %H:%M:%S"
+        },
+        "features": {
+            "log_system_info": True,
+            "log_performance": False,
+            "structured_logging": False
+        }
+    }
+}
 
 
 def sanitize_log_message(message: str) -> str:
@@ -31,11 +100,11 @@ def sanitize_log_message(message: str) -> str:
     Returns:
         Sanitized message with control characters replaced
     """
-    # Replace newlines and carriage returns
-    message = message.replace('\n', '\\n').replace('\r', '\\r')
-    # Remove other control characters
-    message = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', message)
-    return message
+    # Fast path: printable strings have no control characters to handle
+    if message.isprintable():
+        return message
+    # Escape newlines and carriage returns, remove other control characters
+    return message.translate(_CONTROL_CHAR_TABLE)
 
 
 def validate_path(path: Path, base_path: Path) -> Path:
@@ -61,6 +130,198 @@ def validate_path(path: Path, base_path: Path) -> Path:
         raise ValueError(f"Path '{path}' is outside allowed directory '{base_path}'")
 
 
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that batches writes instead of flushing per record.
+
+    Records are written into a large file buffer. The buffer is flushed when
+    a record at or above ``flush_level`` is emitted, every ``flush_interval``
+    seconds from a background thread, and when the handler is closed (which
+    logging.shutdown does at exit). The current file size is tracked in
+    memory so rollover checks don't need a tell() per record, which would
+    flush the buffer.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        mode: str = 'a',
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: Optional[str] = None,
+        delay: bool = False,
+        errors: Optional[str] = None,
+        buffer_size: int = 64 * 1024,
+        flush_level: int = logging.ERROR,
+        flush_interval: float = 30.0,
+    ):
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self.flush_interval = flush_interval
+        self._size = 0
+        super().__init__(
+            filename, mode=mode, maxBytes=maxBytes, backupCount=backupCount,
+            encoding=encoding, delay=delay, errors=errors
+        )
+        
+        self._stop_flusher = threading.Event()
+        if flush_interval > 0:
+            threading.Thread(
+                target=self._periodic_flush, name="log-flush", daemon=True
+            ).start()
+
+    def _open(self):
+        """Open the log file with a large write buffer and record its size."""
+        stream = open(
+            self.baseFilename, self.mode, buffering=self.buffer_size,
+            encoding=self.encoding, errors=self.errors
+        )
+        self._size = stream.tell()
+        return stream
+
+    def _periodic_flush(self) -> None:
+        """Flush buffered records every flush_interval seconds until closed."""
+        while not self._stop_flusher.wait(self.flush_interval):
+            self.flush()
+
+    def shouldRollover(self, record) -> bool:
+        """Determine if rollover should occur, using the tracked file size."""
+        return self._rollover_due(len(self.format(record)) + 1)
+
+    def _rollover_due(self, msg_len: int) -> bool:
+        """Determine if writing msg_len more characters should trigger rollover."""
+        if self.maxBytes <= 0:
+            return False
+        if self.stream is None:  # delay was set...
+            self.stream = self._open()
+        if self._size + msg_len < self.maxBytes:
+            return False
+        # Never rollover anything other than regular files (bpo-45401).
+        # Only reached when rotation is due, and one stat replaces exists + isfile.
+        try:
+            return stat.S_ISREG(os.stat(self.baseFilename).st_mode)
+        except FileNotFoundError:
+            return True
+
+    def emit(self, record) -> None:
+        """Write a record, flushing only for records at or above flush_level."""
+        try:
+            # Format once and use the result for both the rollover check and the write
+            msg = self.format(record) + self.terminator
+            if self._rollover_due(len(msg)):
+                self.doRollover()
+            if self.stream is None:
+                if self.mode != 'w' or not self._closed:
+                    self.stream = self._open()
+            if not self.stream:
+                return
+            self.stream.write(msg)
+            self._size += len(msg)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Stop the periodic flush and close the file."""
+        self._stop_flusher.set()
+        super().close()
+
+
+class _SanitizeFilter(logging.Filter):
+    """Filter that strips control characters from each record's message.
+
+    Installed on the single queue handler, so every record is sanitized
+    once no matter how many target handlers later format it.
+    """
+
+    def filter(self, record):
+        # Sanitize the merged message; args keep their types until here so
+        # numeric placeholders like %d still format correctly
+        try:
+            if record.args:
+                message = record.getMessage()
+                record.msg = sanitize_log_message(message)
+                record.args = None
+            elif not isinstance(record.msg, str) or not record.msg.isprintable():
+                record.msg = sanitize_log_message(str(record.msg))
+        except Exception:
+            # Filters run in the caller's thread, outside Handler.emit's error
+            # handling. Leave a record that cannot be formatted untouched so
+            # the target handler reports it through handleError instead.
+            pass
+        return True
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that passes records through unformatted.
+
+    The stdlib QueueHandler merges the message and traceback into a plain
+    string before queueing. Skipping that lets each target handler apply its
+    own formatter, so tracebacks stay multi-line and are only formatted once.
+    """
+
+    def prepare(self, record):
+        return record
+
+
+# Running queue listeners keyed by logger name
+_queue_listeners: Dict[str, logging.handlers.QueueListener] = {}
+
+
+def _stop_queue_listener(name: str) -> None:
+    """Stop a logger's queue listener, draining queued records, and close its handlers."""
+    listener = _queue_listeners.pop(name, None)
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+@atexit.register
+def _stop_all_queue_listeners() -> None:
+    """Drain all queue listeners at exit (runs before logging.shutdown)."""
+    for name in list(_queue_listeners):
+        _stop_queue_listener(name)
+
+
+def get_logger_handlers(logger: logging.Logger) -> list:
+    """Get the handlers that actually emit records for a logger.
+
+    Includes the handlers behind a queue listener set up by
+    setup_rotating_logger, in place of the queue handler itself.
+
+    Args:
+        logger: Logger to inspect
+
+    Returns:
+        List of handlers
+    """
+    handlers = [h for h in logger.handlers if not isinstance(h, logging.handlers.QueueHandler)]
+    listener = _queue_listeners.get(logger.name)
+    if listener is not None:
+        handlers.extend(listener.handlers)
+    return handlers
+
+
+def flush_logger(logger: logging.Logger) -> None:
+    """Write out every record queued for a logger and flush its handlers.
+
+    The logger stays usable afterwards; its queue listener is restarted.
+
+    Args:
+        logger: Logger set up by setup_rotating_logger
+    """
+    listener = _queue_listeners.get(logger.name)
+    if listener is not None:
+        listener.stop()
+        listener.start()
+    for handler in get_logger_handlers(logger):
+        handler.flush()
+
+
 def setup_rotating_logger(
     name: str,
     log_dir: Optional[str] = None,
@@ -92,27 +353,25 @@ def setup_rotating_logger(
         raise ValueError(f"backup_count must be between {MIN_BACKUP_COUNT} and {MAX_BACKUP_COUNT}")
     
     log_level = log_level.upper()
-    if log_level not in VALID_LOG_LEVELS:
+    level = _LEVEL_MAP.get(log_level)
+    if level is None:
         raise ValueError(f"Invalid log level: {log_level}. Must be one of {VALID_LOG_LEVELS}")
     
     # Sanitize log file name
-    log_file = re.sub(r'[^\w\-_\.]', '_', log_file)
+    log_file = _FILENAME_SANITIZE_RE.sub('_', log_file)
     
     # Create logger
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level))
+    logger.setLevel(level)
     
     # Prevent duplicate handlers
+    _stop_queue_listener(name)
     if logger.hasHandlers():
         for handler in logger.handlers[:]:
             handler.close()
             logger.removeHandler(handler)
     
-    # Get project root safely
-    try:
-        project_root = Path(__file__).resolve().parent.parent.parent
-    except Exception:
-        project_root = Path.cwd()
+    project_root = _PROJECT_ROOT
     
     # Create logs directory if not specified
     if log_dir is None:
@@ -138,41 +397,24 @@ def setup_rotating_logger(
         
         # Validate the log directory is within allowed locations
         # Only allow specific subdirectories in /tmp for security
-        safe_tmp = Path("/tmp") / "pdf_extractor_logs"
-        allowed_dirs = [project_root, safe_tmp, Path.home() / ".cache" / "pdf_extractor"]
-        is_allowed = False
-        for allowed in allowed_dirs:
-            try:
-                validate_path(log_dir_path, allowed)
-                is_allowed = True
-                break
-            except ValueError:
-                continue
+        # log_dir_path is already resolved, so compare against resolved prefixes
+        is_allowed = os.path.join(str(log_dir_path), "").startswith(_ALLOWED_LOG_PREFIXES)
         if not is_allowed:
             raise ValueError(f"Log directory '{log_dir_path}' is not in an allowed location")
     
-    # Ensure log directory exists
+    # Ensure log directory exists; checked every call since it may have
+    # been removed since the last one
     try:
         log_dir_path.mkdir(parents=True, exist_ok=True)
     except Exception as e:
         raise RuntimeError(f"Failed to create log directory '{log_dir_path}': {e}")
     
-    # Create custom formatter that sanitizes messages
-    class SanitizingFormatter(logging.Formatter):
-        def format(self, record):
-            # Sanitize the message
-            record.msg = sanitize_log_message(str(record.msg))
-            # Sanitize any args
-            if record.args:
-                record.args = tuple(sanitize_log_message(str(arg)) for arg in record.args)
-            return super().format(record)
-    
-    detailed_formatter = SanitizingFormatter(
+    detailed_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    simple_formatter = SanitizingFormatter(
+    simple_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -180,24 +422,33 @@ def setup_rotating_logger(
     # Create rotating file handler
     log_path = log_dir_path / log_file
     try:
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = BufferedRotatingFileHandler(
             filename=str(log_path),
             maxBytes=max_bytes,
             backupCount=backup_count,
             encoding='utf-8'
         )
-        file_handler.setLevel(logging.DEBUG)  # Capture all levels in file
         file_handler.setFormatter(detailed_formatter)
-        logger.addHandler(file_handler)
     except Exception as e:
         raise RuntimeError(f"Failed to create rotating file handler: {e}")
+    handlers = [file_handler]
     
     # Add console handler if enabled
     if enable_console:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)  # Less verbose for console
         console_handler.setFormatter(simple_formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
+    
+    # Hand records to a listener thread so callers never block on file I/O
+    # or rotation; the listener applies each handler's own level
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _queue_listeners[name] = listener
+    queue_handler = _RecordQueueHandler(log_queue)
+    queue_handler.addFilter(_SanitizeFilter())
+    logger.addHandler(queue_handler)
     
     # Log initial message
     logger.info(f"Logger initialized - Log file: {log_path}")
@@ -215,68 +466,63 @@ def get_log_level_from_env() -> str:
     return os.environ.get("MCP_LOG_LEVEL", "INFO").upper()
 
 
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively merge ``override`` into ``base``.
+
+    Nested dictionaries are merged key by key; any other value in
+    ``override`` replaces the one in ``base``.
+
+    Args:
+        base: Dictionary to merge into (modified in place)
+        override: Dictionary whose values take precedence
+
+    Returns:
+        The merged ``base`` dictionary
+    """
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _deep_merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+@functools.lru_cache(maxsize=1)
 def load_logging_config() -> Dict[str, Any]:
     """Load logging configuration from file.
 
+    The result is cached for the life of the process and shared between
+    callers, so treat it as read-only. Call
+    ``load_logging_config.cache_clear()`` to pick up config file changes.
+
     Returns:
         Logging configuration dictionary
     """
-    # Default configuration
-    default_config = {
-        "logging": {
-            "level": "INFO",
-            "log_dir": "logs",
-            "rotation": {
-                "max_bytes": 10485760,
-                "backup_count": 5
-            },
-            "console": {
-                "enabled": True,
-                "level": "INFO"
-            },
-            "format": {
-                "include_location": True,
-                "timestamp_format": "%Y-%m-%d %H:%M:%S"
-            },
-            "features": {
-                "log_system_info": True,
-                "log_performance": False,
-                "structured_logging": False
-            }
-        }
-    }
-    
     # Find config file
-    try:
-        project_root = Path(__file__).resolve().parent.parent.parent
-    except Exception:
-        project_root = Path.cwd()
-        
-    config_path = project_root / "config" / "logging_config.yaml"
+    config_path = _PROJECT_ROOT / "config" / "logging_config.yaml"
     
-    # Load from file if exists
-    if config_path.exists():
-        try:
-            with open(config_path, 'r') as f:
-                loaded_config = yaml.safe_load(f)
-                if loaded_config and isinstance(loaded_config, dict):
-                    # Deep merge with defaults
-                    config = default_config.copy()
-                    config.update(loaded_config)
-                else:
-                    logger = logging.getLogger(__name__)
-                    logger.warning(f"Invalid config file format at {config_path}, using defaults")
-                    config = default_config
-        except yaml.YAMLError as e:
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to parse YAML config at {config_path}: {e}")
-            config = default_config
-        except Exception as e:
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to load config from {config_path}: {e}")
-            config = default_config
-    else:
-        config = default_config
+    # Open directly; a missing file is the common case and needs no stat
+    try:
+        with open(config_path, 'r') as f:
+            loaded_config = yaml.load(f, Loader=_YamlLoader)
+            if loaded_config and isinstance(loaded_config, dict):
+                config = _deep_merge(
+                    copy.deepcopy(_DEFAULT_LOGGING_CONFIG), loaded_config
+                )
+            else:
+                logger = logging.getLogger(__name__)
+                logger.warning(f"Invalid config file format at {config_path}, using defaults")
+                config = copy.deepcopy(_DEFAULT_LOGGING_CONFIG)
+    except FileNotFoundError:
+        config = copy.deepcopy(_DEFAULT_LOGGING_CONFIG)
+    except yaml.YAMLError as e:
+        logger = logging.getLogger(__name__)
+        logger.error(f"Failed to parse YAML config at {config_path}: {e}")
+        config = copy.deepcopy(_DEFAULT_LOGGING_CONFIG)
+    except Exception as e:
+        logger = logging.getLogger(__name__)
+        logger.error(f"Failed to load config from {config_path}: {e}")
+        config = copy.deepcopy(_DEFAULT_LOGGING_CONFIG)
     
     return config
 
@@ -351,6 +597,10 @@ def log_system_info(logger: logging.Logger) -> None:
     import platform
     import sys
     
+    # Nothing below is emitted when INFO is suppressed
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     # Check if system info logging is enabled
     config = load_logging_config()
     logging_cfg = config.get("logging", {})
@@ -359,41 +609,39 @@ def log_system_info(logger: logging.Logger) -> None:
         return
     
     logger.info("=== System Information ===")
-    logger.info(f"Python Version: {sys.version.split()[0]}")
-    logger.info(f"Platform: {platform.system()} {platform.release()}")
+    logger.info("Python Version: %s", sys.version.split()[0])
+    logger.info("Platform: %s %s", platform.system(), platform.release())
     # Don't log sensitive information like PID or working directory by default
     # These can be security risks
     logger.info("=========================")
     
     # Log current logging configuration
     logger.info("=== Logging Configuration ===")
-    logger.info(f"Log Level: {logger.level}")
-    for handler in logger.handlers:
+    logger.info("Log Level: %s", logger.level)
+    for handler in get_logger_handlers(logger):
         if isinstance(handler, logging.handlers.RotatingFileHandler):
-            logger.info(f"Log File: {handler.baseFilename}")
-            logger.info(f"Max Bytes: {handler.maxBytes:,}")
-            logger.info(f"Backup Count: {handler.backupCount}")
+            logger.info("Log File: %s", handler.baseFilename)
+            logger.info("Max Bytes: %s", format(handler.maxBytes, ","))
+            logger.info("Backup Count: %s", handler.backupCount)
     logger.info("=============================")
 
 
 class StructuredLogAdapter(logging.LoggerAdapter):
     """Adapter for structured logging in JSON format."""
     
-    def process(self, msg, kwargs):
-        """Process log message for structured output."""
-        # Extract extra fields
-        extra = kwargs.get('extra', {})
-        
-        # Build structured log entry
-        log_entry = {
-            'message': msg,
+    def __init__(self, logger, extra=None):
+        super().__init__(logger, extra or {})
+        # Fields that are the same for every record from this adapter
+        self._base = {
             'timestamp': self.extra.get('timestamp', ''),
             'level': self.extra.get('level', ''),
             'logger': self.extra.get('logger', ''),
         }
+    
+    def process(self, msg, kwargs):
+        """Process log message for structured output."""
+        # Build structured log entry, letting extra fields override the base
+        log_entry = {'message': msg, **self._base, **kwargs.get('extra', {})}
         
-        # Add any additional fields from extra
-        log_entry.update(extra)
-        
-        # Return JSON formatted message
-        return json.dumps(log_entry), kwargs
\ No newline at end of file
+        # Return compact JSON formatted message
+        return orjson.dumps(log_entry).decode(), kwargs
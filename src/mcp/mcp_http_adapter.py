@@ -6,47 +6,290 @@ that allow MCP clients to connect to the PDF RAG system via HTTP.
 """
 
 import asyncio
-import json
+import itertools
 import logging
+import multiprocessing
+import os
+import time
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
-from uuid import uuid4
+from typing import Any, Dict, Iterator, Optional
 
+import numpy as np
+import orjson
 from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse, StreamingResponse
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of formatted answers kept for repeated questions
+ANSWER_CACHE_SIZE = 512
+
+# Result of the initialize method, which never changes
+INITIALIZE_RESULT = {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {
+        "tools": {}
+    },
+    "serverInfo": {
+        "name": "pdf-rag-mcp-http",
+        "version": "1.0.0"
+    }
+}
+
+# Pre-serialized SSE events
+SSE_CONNECTED_EVENT = b"data: " + orjson.dumps({"type": "connection", "status": "connected"}) + b"\n\n"
+SSE_HEARTBEAT_EVENT = b"data: " + orjson.dumps({"type": "heartbeat"}) + b"\n\n"
+SSE_HEARTBEAT_INTERVAL = 30  # seconds
+
+# Queues of connected SSE clients, fed by one shared heartbeat task
+_sse_subscribers: set[asyncio.Queue] = set()
+_sse_heartbeat_task: Optional[asyncio.Task] = None
+
+
+async def _broadcast_sse_heartbeats() -> None:
+    """Send a heartbeat to every SSE subscriber once per interval.
+
+    Exits when the last subscriber disconnects; the next connection
+    starts a new task.
+    """
+    while _sse_subscribers:
+        await asyncio.sleep(SSE_HEARTBEAT_INTERVAL)
+        for subscriber in tuple(_sse_subscribers):
+            try:
+                subscriber.put_nowait(SSE_HEARTBEAT_EVENT)
+            except asyncio.QueueFull:
+                pass  # Client has not consumed the previous heartbeat yet
+
+
+def _subscribe_sse() -> asyncio.Queue:
+    """Register an SSE client for heartbeats."""
+    global _sse_heartbeat_task
+    subscriber: asyncio.Queue = asyncio.Queue(maxsize=1)
+    _sse_subscribers.add(subscriber)
+    if _sse_heartbeat_task is None or _sse_heartbeat_task.done():
+        _sse_heartbeat_task = asyncio.create_task(_broadcast_sse_heartbeats())
+    return subscriber
+
+# Number of PDFs ingested concurrently by pdfrag.add_documents
+INGEST_CONCURRENCY = max(1, int(os.environ.get("MCP_INGEST_CONCURRENCY", "8")))
+
+# JSON-RPC batch bounds: larger batches are rejected, and at most
+# BATCH_CONCURRENCY messages of one batch are handled at a time
+MAX_BATCH_SIZE = 50
+BATCH_CONCURRENCY = 8
+
+# Session tracking bounds
+MAX_SESSIONS = 4096
+SESSION_TTL_SECONDS = 3600.0
+
+# Session IDs for clients that send none: unique per process, not secret
+_SESSION_PREFIX = f"{os.getpid():x}-"
+_session_counter = itertools.count(1)
+
+
+def _new_session_id() -> str:
+    """Generate a session ID for a client that did not supply one."""
+    return _SESSION_PREFIX + format(next(_session_counter), "x")
+
+# How long a pdfrag.get_system_info report is reused
+SYSTEM_INFO_TTL_SECONDS = 30.0
+
+# Documents formatted per chunk of the streamed document list
+DOCUMENT_STREAM_BATCH_SIZE = 100
+
+# Process pool for CPU-bound PDF to markdown conversion, created on first use
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Get the process pool used for PDF conversion."""
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=min(INGEST_CONCURRENCY, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pdf_pool
+
+
+# Semantic cache for paraphrased questions; off unless enabled in config,
+# since technical questions that differ in one word ("maximum" vs
+# "minimum", another part number) still embed very close together
+SEMANTIC_CACHE_SIZE = 2048
+SEMANTIC_CACHE_THRESHOLD = 0.98
+SEMANTIC_CACHE_MIN_CONFIDENCE = 0.6
+
 
 class MCPRequest(BaseModel):
     """MCP JSON-RPC request."""
+    # Requests are built with model_construct, so the schema is rarely needed
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     jsonrpc: str = "2.0"
     id: Optional[Any] = None
     method: str
     params: Optional[Dict[str, Any]] = None
 
 
-class MCPResponse(BaseModel):
-    """MCP JSON-RPC response."""
-    jsonrpc: str = "2.0"
-    id: Optional[Any] = None
-    result: Optional[Any] = None
-    error: Optional[Dict[str, Any]] = None
+def _ok(text: str) -> dict:
+    """Build a successful MCP tool result."""
+    return {"content": [{"type": "text", "text": text}], "isError": False}
+
+
+def _err(text: str) -> dict:
+    """Build a failed MCP tool result."""
+    return {"content": [{"type": "text", "text": text}], "isError": True}
+
+
+def _invalid_request(reason: str) -> bytes:
+    """Build a serialized JSON-RPC Invalid Request error."""
+    return orjson.dumps({
+        "jsonrpc": "2.0",
+        "id": None,
+        "error": {"code": -32600, "message": f"Invalid Request: {reason}"},
+    })
+
+
+def _iter_pdfs(root: Path, recursive: bool) -> Iterator[os.DirEntry]:
+    """Yield directory entries for PDF files under a folder.
+
+    Uses os.scandir so each entry's stat result is cached and no Path
+    objects are built for non-PDF entries. Symlinked directories are not
+    followed.
+
+    Args:
+        root: Folder to search
+        recursive: Whether to descend into subfolders
+
+    Yields:
+        Directory entries for files with a .pdf extension
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.name.lower().endswith(".pdf") and entry.is_file():
+                    yield entry
+
+
+class _SemanticAnswerCache:
+    """Fixed-size cache of answers looked up by question embedding similarity.
+
+    Question embeddings are stored L2-normalized in a preallocated matrix so
+    a lookup is a single matrix-vector product. When full, the oldest entry
+    is overwritten.
+    """
+
+    def __init__(self, max_size: int, threshold: float):
+        self.max_size = max_size
+        self.threshold = threshold
+        self._keys: Optional[np.ndarray] = None
+        self._top_ks = np.zeros(max_size, dtype=np.int64)
+        # Scratch buffers so lookups allocate no per-call arrays
+        self._scores = np.empty(max_size, dtype=np.float32)
+        self._mismatch = np.empty(max_size, dtype=bool)
+        self._values: list[Optional[str]] = [None] * max_size
+        self._count = 0
+        self._next = 0
+
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else None
+
+    def get(self, embedding: np.ndarray, top_k: int) -> Optional[str]:
+        """Return the cached answer for the most similar question, if close enough."""
+        if self._count == 0:
+            return None
+        query = self._normalize(embedding)
+        if query is None or query.shape[0] != self._keys.shape[1]:
+            return None
+        count = self._count
+        scores = np.dot(self._keys[:count], query, out=self._scores[:count])
+        mismatch = np.not_equal(self._top_ks[:count], top_k, out=self._mismatch[:count])
+        scores[mismatch] = -1.0
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            return self._values[best]
+        return None
+
+    def put(self, embedding: np.ndarray, top_k: int, answer_text: str) -> None:
+        """Store an answer under its question embedding."""
+        key = self._normalize(embedding)
+        if key is None:
+            return
+        if self._keys is None or self._keys.shape[1] != key.shape[0]:
+            self._keys = np.empty((self.max_size, key.shape[0]), dtype=np.float32)
+            self.clear()
+        slot = self._next
+        self._keys[slot] = key
+        self._top_ks[slot] = top_k
+        self._values[slot] = answer_text
+        self._next = (slot + 1) % self.max_size
+        self._count = min(self._count + 1, self.max_size)
+
+    def clear(self) -> None:
+        """Drop all cached answers."""
+        self._values = [None] * self.max_size
+        self._count = 0
+        self._next = 0
 
 
 class MCPHTTPAdapter:
     """Adapter to handle MCP protocol over HTTP transport."""
     
-    def __init__(self, rag_engine):
+    def __init__(
+        self,
+        rag_engine,
+        semantic_cache: bool = False,
+        semantic_cache_threshold: float = SEMANTIC_CACHE_THRESHOLD,
+    ):
         """Initialize the MCP HTTP adapter.
         
         Args:
             rag_engine: The RAG engine instance
+            semantic_cache: Whether to reuse answers for questions whose
+                embeddings are nearly identical to a cached question
+            semantic_cache_threshold: Minimum cosine similarity for a
+                semantic cache hit
         """
         self.rag_engine = rag_engine
-        self.sessions = {}  # Store session state
+        # Session ID -> last seen (monotonic time), least recently seen first
+        self.sessions: OrderedDict[str, float] = OrderedDict()
         self.tools = self._get_tools()
+        # Serialized results for methods whose response only varies by id
+        self._static_results = {
+            "initialize": orjson.dumps(INITIALIZE_RESULT),
+            "tools/list": orjson.dumps({"tools": self.tools}),
+        }
+        # (monotonic time, formatted report) from the last get_system_info
+        self._system_info_cache: tuple[float, Optional[str]] = (0.0, None)
+        # Tool name -> coroutine handling that tool's arguments
+        self._tool_handlers = {
+            "pdfrag.query_technical_docs": self._tool_query_technical_docs,
+            "pdfrag.add_document": self._tool_add_document,
+            "pdfrag.add_documents": self._tool_add_documents,
+            "pdfrag.list_documents": self._tool_list_documents,
+            "pdfrag.get_system_info": self._tool_get_system_info,
+            "pdfrag.clear_database": self._tool_clear_database,
+        }
+        # Formatted answers keyed by (stripped question, top_k), LRU order
+        self._answer_cache: OrderedDict[tuple[str, Any], str] = OrderedDict()
+        # Bumped whenever the corpus changes; answers computed under an
+        # older generation are not cached
+        self._cache_generation = 0
+        # Answers for paraphrased questions, matched by embedding similarity
+        self._semantic_cache: Optional[_SemanticAnswerCache] = (
+            _SemanticAnswerCache(SEMANTIC_CACHE_SIZE, semantic_cache_threshold)
+            if semantic_cache else None
+        )
         
     def _get_tools(self) -> list[dict]:
         """Get available MCP tools."""
@@ -145,253 +388,321 @@ class MCPHTTPAdapter:
             },
         ]
     
+    async def _add_pdf(self, pdf_path: Path, document_type: str) -> bool:
+        """Add a PDF, converting it in the process pool.
+
+        Conversion is CPU-bound and runs in a worker process; embedding and
+        storage then run on the default executor in this process.
+
+        Args:
+            pdf_path: Path to the PDF file
+            document_type: Type of document
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Import here; the converter exits if pymupdf4llm is missing
+        from pdf_extractor.converter import process_pdf_file
+        
+        loop = asyncio.get_running_loop()
+        success, error = await loop.run_in_executor(
+            _get_pdf_pool(), process_pdf_file, pdf_path, self.rag_engine.markdown_path(pdf_path)
+        )
+        if not success:
+            logger.error(f"Failed to convert PDF {pdf_path.name}: {error}")
+            return False
+        
+        return await loop.run_in_executor(
+            None, self.rag_engine.add_converted_pdf_document, pdf_path, document_type
+        )
+    
+    def _touch_session(self, session_id: str) -> None:
+        """Record activity for a session, evicting idle and excess sessions.
+        
+        Args:
+            session_id: Session identifier
+        """
+        now = time.monotonic()
+        sessions = self.sessions
+        sessions.pop(session_id, None)
+        sessions[session_id] = now
+        # Oldest sessions are first, so stop at the first one still active
+        while sessions:
+            oldest_id, last_seen = next(iter(sessions.items()))
+            if len(sessions) <= MAX_SESSIONS and now - last_seen < SESSION_TTL_SECONDS:
+                break
+            del sessions[oldest_id]
+    
+    def invalidate_answer_caches(self) -> None:
+        """Drop cached answers after the knowledge base has changed.
+
+        Must be called by every code path that adds or removes documents,
+        including the REST endpoints that share this adapter's RAG engine.
+        """
+        self._cache_generation += 1
+        self._answer_cache.clear()
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
+    
     async def call_tool(self, name: str, arguments: dict) -> dict:
         """Handle tool calls."""
+        handler = self._tool_handlers.get(name)
+        if handler is None:
+            return _err(f"Unknown tool: {name}")
         try:
-            if name == "pdfrag.query_technical_docs":
-                question = arguments.get("question")
-                top_k = arguments.get("top_k", 5)
-                    
-                if not question:
-                    return {
-                        "content": [{"type": "text", "text": "Error: Question is required"}],
-                        "isError": True,
-                    }
-                    
-                # Execute query
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None, self.rag_engine.query, question, top_k
-                )
-                    
-                # Format response
-                answer_text = f"**Answer**: {response.answer}\n\n"
-                answer_text += f"**Confidence**: {response.confidence:.2f}\n\n"
-                    
-                if response.sources:
-                    answer_text += "**Sources**:\n"
-                    for source in response.sources:
-                        answer_text += f"- {source.get('document', 'Unknown')} "
-                        if 'page' in source:
-                            answer_text += f"(page {source['page']})"
-                        answer_text += "\n"
-                    
-                return {
-                    "content": [{"type": "text", "text": answer_text}],
-                    "isError": False
-                }
+            return await handler(arguments)
+        except Exception as e:
+            logger.error(f"Tool execution error: {e}")
+            return _err(f"Error: {str(e)}")
+    
+    async def _tool_query_technical_docs(self, arguments: dict) -> dict:
+        """Answer a question from the knowledge base."""
+        loop = asyncio.get_running_loop()
+        question = arguments.get("question")
+        top_k = arguments.get("top_k", 5)
             
-            elif name == "pdfrag.add_document":
-                pdf_path = arguments.get("pdf_path")
-                document_type = arguments.get("document_type", "unknown")
-                
-                if not pdf_path:
-                    return {
-                        "content": [{"type": "text", "text": "Error: pdf_path is required"}],
-                        "isError": True,
-                    }
-                
-                path = Path(pdf_path)
-                
-                if not path.exists():
-                    return {
-                        "content": [{"type": "text", "text": f"Error: PDF file not found: {pdf_path}"}],
-                        "isError": True,
-                    }
-                
-                if not path.suffix.lower() == ".pdf":
-                    return {
-                        "content": [{"type": "text", "text": f"Error: Not a PDF file: {pdf_path}"}],
-                        "isError": True,
-                    }
-                
-                # Add document
-                loop = asyncio.get_event_loop()
-                success = await loop.run_in_executor(
-                    None, self.rag_engine.add_pdf_document, path, document_type
-                )
-                
-                if success:
-                    return {
-                        "content": [{"type": "text", "text": f"Successfully added document: {path.name}"}],
-                        "isError": False
-                    }
-                else:
-                    return {
-                        "content": [{"type": "text", "text": f"Failed to add document: {path.name}"}],
-                        "isError": True
-                    }
-                
-            elif name == "pdfrag.add_documents":
-                folder_path = arguments.get("folder_path")
-                document_type = arguments.get("document_type", "unknown")
-                recursive = arguments.get("recursive", False)
-                
-                if not folder_path:
-                    return {
-                        "content": [{"type": "text", "text": "Error: folder_path is required"}],
-                        "isError": True,
-                    }
-                
-                folder = Path(folder_path)
-                
-                if not folder.exists():
-                    return {
-                        "content": [{"type": "text", "text": f"Error: Folder not found: {folder_path}"}],
-                        "isError": True,
-                    }
-                
-                if not folder.is_dir():
-                    return {
-                        "content": [{"type": "text", "text": f"Error: Not a directory: {folder_path}"}],
-                        "isError": True,
-                    }
-                
-                # Find all PDF files
-                if recursive:
-                    pdf_files = list(folder.rglob("*.pdf"))
-                else:
-                    pdf_files = list(folder.glob("*.pdf"))
-                
-                if not pdf_files:
-                    return {
-                        "content": [{"type": "text", "text": f"No PDF files found in {folder_path}"}],
-                        "isError": False
-                    }
-                
-                # Add documents
-                success_count = 0
-                failed_files = []
-                
-                for pdf_file in pdf_files:
-                    try:
-                        loop = asyncio.get_event_loop()
-                        success = await loop.run_in_executor(
-                            None, self.rag_engine.add_pdf_document, pdf_file, document_type
-                        )
-                        if success:
-                            success_count += 1
-                        else:
-                            failed_files.append(pdf_file.name)
-                    except Exception as e:
-                        logger.error(f"Failed to add {pdf_file.name}: {e}")
-                        failed_files.append(pdf_file.name)
-                
-                result_text = f"Processed {len(pdf_files)} files.\n"
-                result_text += f"Successfully added: {success_count}\n"
-                result_text += f"Failed: {len(failed_files)}"
-                
-                if failed_files:
-                    result_text += f"\n\nFailed files:\n"
-                    for f in failed_files[:10]:  # Show first 10
-                        result_text += f"- {f}\n"
-                    if len(failed_files) > 10:
-                        result_text += f"... and {len(failed_files) - 10} more"
-                
-                return {
-                    "content": [{"type": "text", "text": result_text}],
-                    "isError": len(failed_files) > 0
-                }
+        if not question:
+            return _err("Error: Question is required")
             
-            elif name == "pdfrag.list_documents":
-                loop = asyncio.get_event_loop()
-                documents = await loop.run_in_executor(
-                    None, self.rag_engine.list_documents
+        # Serve repeated questions from the answer cache. Case is kept:
+        # part numbers and identifiers can differ only in case.
+        cache_key = (question.strip(), top_k)
+        cached_text = self._answer_cache.get(cache_key)
+        if cached_text is not None:
+            self._answer_cache.move_to_end(cache_key)
+            return _ok(cached_text)
+        
+        # Fall back to answers for near-identical questions
+        question_embedding = None
+        if self._semantic_cache is not None:
+            try:
+                question_embedding = await loop.run_in_executor(
+                    None, self.rag_engine.embedder.generate_embedding, question
                 )
-                    
-                if not documents:
-                    return {
-                        "content": [{"type": "text", "text": "No documents found in the knowledge base."}],
-                        "isError": False
-                    }
-                    
-                doc_list = "**Documents in Knowledge Base**:\n\n"
-                for doc in documents:
-                    doc_list += f"- **{doc['document']}**\n"
-                    doc_list += f"  - Type: {doc.get('type', 'unknown')}\n"
-                    doc_list += f"  - Chunks: {doc.get('chunk_count', 0)}\n"
-                    doc_list += f"  - Source: {doc.get('source', 'N/A')}\n\n"
-                    
-                return {
-                    "content": [{"type": "text", "text": doc_list}],
-                    "isError": False
-                }
-                
-            elif name == "pdfrag.get_system_info":
-                system_info = self.rag_engine.get_system_info()
-                test_results = self.rag_engine.test_components()
-                    
-                info_text = "**System Information**:\n\n"
-                info_text += "**Component Status**:\n"
-                for component, status in test_results.items():
-                    status_emoji = "✅" if status else "❌"
-                    info_text += f"- {component}: {status_emoji}\n"
-                    
-                info_text += f"\n**Configuration**:\n"
-                info_text += f"- LLM: {system_info.get('llm_type', 'unknown')} ({system_info.get('llm_model', 'unknown')})\n"
-                info_text += f"- Embedding Model: {system_info.get('embedding_model', 'unknown')}\n"
-                info_text += f"- Collection: {system_info.get('collection_name', 'unknown')}\n"
-                    
-                return {
-                    "content": [{"type": "text", "text": info_text}],
-                    "isError": False
-                }
+            except Exception as e:
+                logger.warning(f"Semantic cache lookup skipped: {e}")
+        if question_embedding is not None:
+            cached_text = self._semantic_cache.get(question_embedding, top_k)
+            if cached_text is not None:
+                return _ok(cached_text)
+        
+        # Execute query
+        generation = self._cache_generation
+        response = await loop.run_in_executor(
+            None, self.rag_engine.query, question, top_k
+        )
             
-            elif name == "pdfrag.clear_database":
-                confirm = arguments.get("confirm", False)
-                
-                if not confirm:
-                    return {
-                        "content": [{"type": "text", "text": "Error: You must set confirm=true to clear the database"}],
-                        "isError": True,
-                    }
-                
-                # Get current document count first
-                loop = asyncio.get_event_loop()
-                documents = await loop.run_in_executor(
-                    None, self.rag_engine.list_documents
-                )
-                doc_count = len(documents)
-                total_chunks = sum(doc.get("chunk_count", 0) for doc in documents)
-                
-                if doc_count == 0:
-                    return {
-                        "content": [{"type": "text", "text": "Database is already empty"}],
-                        "isError": False
-                    }
-                
-                # Clear the database
-                success = await loop.run_in_executor(
-                    None, self.rag_engine.vector_store.clear_collection
-                )
-                
-                if success:
-                    return {
-                        "content": [{"type": "text", "text": f"Successfully cleared database. Removed {doc_count} documents ({total_chunks} chunks)."}],
-                        "isError": False
-                    }
-                else:
-                    return {
-                        "content": [{"type": "text", "text": "Failed to clear database"}],
-                        "isError": True
-                    }
-                
-            else:
-                return {
-                    "content": [{"type": "text", "text": f"Unknown tool: {name}"}],
-                    "isError": True,
-                }
-                    
-        except Exception as e:
-            logger.error(f"Tool execution error: {e}")
-            return {
-                "content": [{"type": "text", "text": f"Error: {str(e)}"}],
-                "isError": True,
-            }
+        # Format response
+        parts = [
+            f"**Answer**: {response.answer}\n\n",
+            f"**Confidence**: {response.confidence:.2f}\n\n",
+        ]
+            
+        if response.sources:
+            parts.append("**Sources**:\n")
+            parts.extend(
+                f"- {source.get('document', 'Unknown')} "
+                + (f"(page {source['page']})" if 'page' in source else "")
+                + "\n"
+                for source in response.sources
+            )
+        answer_text = "".join(parts)
+            
+        if response.sources and generation == self._cache_generation:
+            # Only grounded answers are cached; errors and empty
+            # results come back without sources. Answers that raced
+            # with a corpus change are not cached either.
+            self._answer_cache[cache_key] = answer_text
+            if len(self._answer_cache) > ANSWER_CACHE_SIZE:
+                self._answer_cache.popitem(last=False)
+            if (
+                question_embedding is not None
+                and response.confidence > SEMANTIC_CACHE_MIN_CONFIDENCE
+            ):
+                self._semantic_cache.put(question_embedding, top_k, answer_text)
+            
+        return _ok(answer_text)
+    
+    async def _tool_add_document(self, arguments: dict) -> dict:
+        """Add a single PDF document."""
+        pdf_path = arguments.get("pdf_path")
+        document_type = arguments.get("document_type", "unknown")
+        
+        if not pdf_path:
+            return _err("Error: pdf_path is required")
+        
+        if not os.path.exists(pdf_path):
+            return _err(f"Error: PDF file not found: {pdf_path}")
+        
+        if not pdf_path.lower().endswith(".pdf"):
+            return _err(f"Error: Not a PDF file: {pdf_path}")
+        
+        # Add document; cached answers may no longer reflect the corpus
+        try:
+            success = await self._add_pdf(Path(pdf_path), document_type)
+        finally:
+            self.invalidate_answer_caches()
+        name = os.path.basename(pdf_path)
+        
+        if success:
+            return _ok(f"Successfully added document: {name}")
+        else:
+            return _err(f"Failed to add document: {name}")
+    
+    async def _tool_add_documents(self, arguments: dict) -> dict:
+        """Add all PDF documents in a folder."""
+        loop = asyncio.get_running_loop()
+        folder_path = arguments.get("folder_path")
+        document_type = arguments.get("document_type", "unknown")
+        recursive = arguments.get("recursive", False)
+        
+        if not folder_path:
+            return _err("Error: folder_path is required")
+        
+        folder = Path(folder_path)
+        
+        if not folder.exists():
+            return _err(f"Error: Folder not found: {folder_path}")
+        
+        if not folder.is_dir():
+            return _err(f"Error: Not a directory: {folder_path}")
+        
+        # Find all PDF files
+        pdf_files = await loop.run_in_executor(
+            None, lambda: [Path(entry.path) for entry in _iter_pdfs(folder, recursive)]
+        )
+        
+        if not pdf_files:
+            return _ok(f"No PDF files found in {folder_path}")
+        
+        # Add documents; cached answers may no longer reflect the corpus
+        semaphore = asyncio.Semaphore(min(INGEST_CONCURRENCY, len(pdf_files)))
+        # Conversion writes md/<stem>.md, so same-stem files take turns
+        stem_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        
+        async def add_one(pdf_file: Path) -> bool:
+            async with stem_locks[pdf_file.stem], semaphore:
+                try:
+                    return await self._add_pdf(pdf_file, document_type)
+                except Exception as e:
+                    logger.error(f"Failed to add {pdf_file.name}: {e}")
+                    return False
+        
+        try:
+            results = await asyncio.gather(*(add_one(pdf_file) for pdf_file in pdf_files))
+        finally:
+            self.invalidate_answer_caches()
+        success_count = sum(1 for success in results if success)
+        failed_files = [
+            pdf_file.name for pdf_file, success in zip(pdf_files, results) if not success
+        ]
+        
+        parts = [
+            f"Processed {len(pdf_files)} files.\n",
+            f"Successfully added: {success_count}\n",
+            f"Failed: {len(failed_files)}",
+        ]
+        
+        if failed_files:
+            parts.append("\n\nFailed files:\n")
+            parts.extend(f"- {f}\n" for f in failed_files[:10])  # Show first 10
+            if len(failed_files) > 10:
+                parts.append(f"... and {len(failed_files) - 10} more")
+        result_text = "".join(parts)
+        
+        return _err(result_text) if failed_files else _ok(result_text)
+    
+    async def _tool_list_documents(self, arguments: dict) -> dict:
+        """List documents in the knowledge base."""
+        loop = asyncio.get_running_loop()
+        documents = await loop.run_in_executor(
+            None, self.rag_engine.list_documents
+        )
+            
+        if not documents:
+            return _ok("No documents found in the knowledge base.")
+            
+        parts = ["**Documents in Knowledge Base**:\n\n"]
+        parts.extend(map(self._format_document, documents))
+        doc_list = "".join(parts)
+            
+        return _ok(doc_list)
+    
+    @staticmethod
+    def _format_document(doc: dict) -> str:
+        """Format one document entry for the markdown document list."""
+        return (
+            f"- **{doc['document']}**\n"
+            f"  - Type: {doc.get('type', 'unknown')}\n"
+            f"  - Chunks: {doc.get('chunk_count', 0)}\n"
+            f"  - Source: {doc.get('source', 'N/A')}\n\n"
+        )
     
-    async def handle_mcp_request(self, request: Request) -> JSONResponse:
+    async def _tool_get_system_info(self, arguments: dict) -> dict:
+        """Report component status and configuration."""
+        # Component tests probe the LLM and embedding backends, so reuse a
+        # recent report instead of re-running them on every poll
+        now = time.monotonic()
+        cached_at, cached_text = self._system_info_cache
+        if cached_text is not None and now - cached_at < SYSTEM_INFO_TTL_SECONDS:
+            return _ok(cached_text)
+        
+        loop = asyncio.get_running_loop()
+        system_info = await loop.run_in_executor(None, self.rag_engine.get_system_info)
+        test_results = await loop.run_in_executor(None, self.rag_engine.test_components)
+            
+        parts = ["**System Information**:\n\n", "**Component Status**:\n"]
+        parts.extend(
+            f"- {component}: {'✅' if ok else '❌'}\n"
+            for component, ok in test_results.items()
+        )
+        parts.append("\n**Configuration**:\n")
+        parts.append(f"- LLM: {system_info.get('llm_type', 'unknown')} ({system_info.get('llm_model', 'unknown')})\n")
+        parts.append(f"- Embedding Model: {system_info.get('embedding_model', 'unknown')}\n")
+        parts.append(f"- Collection: {system_info.get('collection_name', 'unknown')}\n")
+        info_text = "".join(parts)
+        self._system_info_cache = (now, info_text)
+            
+        return _ok(info_text)
+    
+    async def _tool_clear_database(self, arguments: dict) -> dict:
+        """Clear the vector database."""
+        loop = asyncio.get_running_loop()
+        confirm = arguments.get("confirm", False)
+        
+        if not confirm:
+            return _err("Error: You must set confirm=true to clear the database")
+        
+        # Get current document and chunk counts first
+        doc_count, total_chunks = await loop.run_in_executor(
+            None, self.rag_engine.count_documents
+        )
+        
+        if doc_count == 0:
+            return _ok("Database is already empty")
+        
+        # Clear the database and the answers derived from it
+        try:
+            success = await loop.run_in_executor(
+                None, self.rag_engine.vector_store.clear_collection
+            )
+        finally:
+            self.invalidate_answer_caches()
+        
+        if success:
+            return _ok(f"Successfully cleared database. Removed {doc_count} documents ({total_chunks} chunks).")
+        else:
+            return _err("Failed to clear database")
+    
+    async def handle_mcp_request(self, request: Request) -> Response:
         """Handle MCP JSON-RPC requests.
         
+        Accepts a single request object or a JSON-RPC batch (array of at
+        most MAX_BATCH_SIZE request objects). Batched messages are handled
+        with bounded concurrency and their responses returned in request
+        order. Notifications (requests without an id) get no response; a
+        request made up only of notifications is answered with 202.
+        
         Args:
             request: FastAPI request object
             
@@ -400,33 +711,111 @@ class MCPHTTPAdapter:
         """
         try:
             # Parse request body
-            body = await request.json()
-            mcp_request = MCPRequest(**body)
+            body = orjson.loads(await request.body())
+        except orjson.JSONDecodeError:
+            return ORJSONResponse(
+                content={
+                    "jsonrpc": "2.0",
+                    "id": None,
+                    "error": {
+                        "code": -32700,
+                        "message": "Parse error"
+                    }
+                },
+                status_code=200
+            )
+        
+        # Get or create session
+        session_id = request.headers.get("X-Session-ID") or _new_session_id()
+        self._touch_session(session_id)
+        
+        if isinstance(body, list):
+            if not body or len(body) > MAX_BATCH_SIZE:
+                reason = "empty batch" if not body else f"batch exceeds {MAX_BATCH_SIZE} requests"
+                return ORJSONResponse(
+                    content={
+                        "jsonrpc": "2.0",
+                        "id": None,
+                        "error": {
+                            "code": -32600,
+                            "message": f"Invalid Request: {reason}"
+                        }
+                    },
+                    status_code=200,
+                    headers={"X-Session-ID": session_id}
+                )
+            semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
             
-            # Get or create session
-            session_id = request.headers.get("X-Session-ID", str(uuid4()))
+            async def handle_item(item: Any) -> Optional[bytes]:
+                async with semaphore:
+                    return await self._handle_message(item)
+            
+            responses = await asyncio.gather(*(handle_item(item) for item in body))
+            responses = [response for response in responses if response is not None]
+            content = b"[" + b",".join(responses) + b"]" if responses else None
+        else:
+            content = await self._handle_message(body)
+        
+        if content is None:
+            # Only notifications: nothing to send back
+            return Response(status_code=202, headers={"X-Session-ID": session_id})
+        
+        return Response(
+            content=content,
+            media_type="application/json",
+            headers={"X-Session-ID": session_id}
+        )
+    
+    async def _handle_message(self, body: Any) -> Optional[bytes]:
+        """Handle a single JSON-RPC request object.
+        
+        Args:
+            body: Parsed JSON-RPC request
+            
+        Returns:
+            Serialized JSON-RPC response, or None for a notification
+        """
+        # Check only the fields dispatch relies on, then build the envelope
+        # without running full model validation
+        if not isinstance(body, dict):
+            return _invalid_request("request must be a JSON object")
+        method = body.get("method")
+        if not isinstance(method, str):
+            return _invalid_request("method must be a string")
+        params = body.get("params")
+        if params is not None and not isinstance(params, dict):
+            return _invalid_request("params must be an object")
+        mcp_request = MCPRequest.model_construct(
+            jsonrpc=body.get("jsonrpc", "2.0"),
+            id=body.get("id"),
+            method=method,
+            params=params,
+        )
+        
+        response = await self._dispatch(mcp_request)
+        # Notifications (no id member) are processed but never answered
+        return response if "id" in body else None
+    
+    async def _dispatch(self, mcp_request: MCPRequest) -> bytes:
+        """Run a validated JSON-RPC request.
+        
+        Args:
+            mcp_request: Request envelope
+            
+        Returns:
+            Serialized JSON-RPC response
+        """
+        try:
+            # initialize and tools/list: splice the id into the prebuilt result
+            static_result = self._static_results.get(mcp_request.method)
+            if static_result is not None:
+                return (
+                    b'{"jsonrpc":"2.0","id":' + orjson.dumps(mcp_request.id)
+                    + b',"result":' + static_result + b"}"
+                )
             
             # Handle different methods
-            if mcp_request.method == "initialize":
-                # Initialize session
-                result = {
-                    "protocolVersion": "2024-11-05",
-                    "capabilities": {
-                        "tools": {}
-                    },
-                    "serverInfo": {
-                        "name": "pdf-rag-mcp-http",
-                        "version": "1.0.0"
-                    }
-                }
-                
-            elif mcp_request.method == "tools/list":
-                # List available tools
-                result = {
-                    "tools": self.tools
-                }
-                
-            elif mcp_request.method == "tools/call":
+            if mcp_request.method == "tools/call":
                 # Call a tool
                 params = mcp_request.params or {}
                 tool_name = params.get("name")
@@ -442,55 +831,68 @@ class MCPHTTPAdapter:
                 
             else:
                 # Unknown method
-                return JSONResponse(
-                    content={
-                        "jsonrpc": "2.0",
-                        "id": mcp_request.id,
-                        "error": {
-                            "code": -32601,
-                            "message": f"Method not found: {mcp_request.method}"
-                        }
-                    },
-                    status_code=200,
-                    headers={"X-Session-ID": session_id}
-                )
-            
-            # Return successful response
-            return JSONResponse(
-                content={
+                return orjson.dumps({
                     "jsonrpc": "2.0",
                     "id": mcp_request.id,
-                    "result": result
-                },
-                status_code=200,
-                headers={"X-Session-ID": session_id}
-            )
-            
-        except json.JSONDecodeError:
-            return JSONResponse(
-                content={
-                    "jsonrpc": "2.0",
-                    "id": None,
                     "error": {
-                        "code": -32700,
-                        "message": "Parse error"
+                        "code": -32601,
+                        "message": f"Method not found: {mcp_request.method}"
                     }
-                },
-                status_code=200
-            )
+                })
+            
+            # Return successful response
+            return orjson.dumps({
+                "jsonrpc": "2.0",
+                "id": mcp_request.id,
+                "result": result
+            })
+            
         except Exception as e:
             logger.error(f"MCP request error: {e}", exc_info=True)
-            return JSONResponse(
-                content={
-                    "jsonrpc": "2.0",
-                    "id": getattr(mcp_request, 'id', None) if 'mcp_request' in locals() else None,
-                    "error": {
-                        "code": -32603,
-                        "message": f"Internal error: {str(e)}"
-                    }
-                },
-                status_code=200
-            )
+            return orjson.dumps({
+                "jsonrpc": "2.0",
+                "id": mcp_request.id,
+                "error": {
+                    "code": -32603,
+                    "message": f"Internal error: {str(e)}"
+                }
+            })
+    
+    async def handle_documents_stream(self) -> StreamingResponse:
+        """Stream the knowledge base document list as markdown.
+        
+        Produces the same text as the pdfrag.list_documents tool. Documents
+        are fetched from the store a page at a time as the response is
+        sent, so neither the list nor the text is ever held in full.
+        
+        Returns:
+            Streaming markdown response
+        """
+        loop = asyncio.get_running_loop()
+        
+        async def document_generator():
+            """Generate the document list one store page at a time."""
+            offset = 0
+            while True:
+                try:
+                    batch = await loop.run_in_executor(
+                        None, self.rag_engine.list_documents_page,
+                        offset, DOCUMENT_STREAM_BATCH_SIZE,
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to list documents at offset {offset}: {e}")
+                    return
+                if offset == 0:
+                    if not batch:
+                        yield "No documents found in the knowledge base."
+                        return
+                    yield "**Documents in Knowledge Base**:\n\n"
+                yield "".join(map(self._format_document, batch))
+                if len(batch) < DOCUMENT_STREAM_BATCH_SIZE:
+                    return
+                offset += len(batch)
+        
+        return StreamingResponse(document_generator(), media_type="text/markdown; charset=utf-8")
     
     async def handle_sse_request(self, request: Request):
         """Handle Server-Sent Events (SSE) for MCP.
@@ -501,22 +903,25 @@ class MCPHTTPAdapter:
         Returns:
             SSE streaming response
         """
-        session_id = request.headers.get("X-Session-ID", str(uuid4()))
+        session_id = request.headers.get("X-Session-ID") or _new_session_id()
+        self._touch_session(session_id)
         
         async def event_generator():
             """Generate SSE events."""
+            subscriber = _subscribe_sse()
             try:
                 # Send initial connection event
-                yield f"data: {json.dumps({'type': 'connection', 'status': 'connected'})}\n\n"
+                yield SSE_CONNECTED_EVENT
                 
-                # Keep connection alive
+                # Keep connection alive with the shared heartbeats
                 while True:
-                    await asyncio.sleep(30)  # Send heartbeat every 30 seconds
-                    yield f"data: {json.dumps({'type': 'heartbeat'})}\n\n"
+                    yield await subscriber.get()
                     
             except asyncio.CancelledError:
                 logger.info(f"SSE connection closed for session {session_id}")
                 raise
+            finally:
+                _sse_subscribers.discard(subscriber)
         
         return StreamingResponse(
             event_generator(),
@@ -6,6 +6,8 @@ RAG-powered technical documentation queries through standardized tools.
 """
 
 import asyncio
+import copy
+import functools
 import logging
 import os
 from pathlib import Path
@@ -38,6 +40,39 @@ except ImportError:
 # Configure logger with rotation
 logger = configure_mcp_logging(server_type="mcp", enable_console=True)
 
+# Prefer the LibYAML-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file, cached per path and modification time.
+
+    Args:
+        path: Path to the YAML file
+        mtime_ns: Modification time of the file, part of the cache key
+
+    Returns:
+        Parsed YAML content
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _load_yaml(path: Path) -> Any:
+    """Load a YAML file, reparsing only when it has changed.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML content, safe for the caller to modify
+    """
+    return copy.deepcopy(_parse_yaml(str(path), path.stat().st_mtime_ns))
+
 
 class PDFRAGMCPServer:
     """MCP Server for PDF RAG system."""
@@ -63,8 +98,7 @@ class PDFRAGMCPServer:
         rag_config_path = self._project_root / "config" / "rag_config.yaml"
         if rag_config_path.exists():
             try:
-                with open(rag_config_path) as f:
-                    config.update(yaml.safe_load(f))
+                config.update(_load_yaml(rag_config_path))
                 logger.info("Loaded RAG configuration")
             except Exception as e:
                 logger.error(f"Failed to load RAG config: {e}")
@@ -73,8 +107,7 @@ class PDFRAGMCPServer:
         mcp_config_path = self._project_root / "config" / "mcp_config.yaml"
         if mcp_config_path.exists():
             try:
-                with open(mcp_config_path) as f:
-                    config.update(yaml.safe_load(f))
+                config.update(_load_yaml(mcp_config_path))
                 logger.info("Loaded MCP configuration")
             except Exception as e:
                 logger.error(f"Failed to load MCP config: {e}")
@@ -197,7 +230,7 @@ class PDFRAGMCPServer:
 
         # Get RAG response
         logger.debug(f"Processing query: {question[:100]}...")
-        response = self.rag_engine.query(question, top_k)
+        response = await self.rag_engine.aquery(question, top_k)
         logger.info(f"Query processed successfully - Confidence: {response.confidence:.2f}, Sources: {len(response.sources)}")
 
         # Format response with sources
@@ -367,6 +400,8 @@ class PDFRAGMCPServer:
                 "embedding_model": self.config.get("embedding", {}).get(
                     "model", "sentence-transformers/all-MiniLM-L6-v2"
                 ),
+                "embedding_batch_size": self.config.get("embedding", {}).get("batch_size", 64),
+                "embedding_precision": self.config.get("embedding", {}).get("precision", "fp32"),
                 "vector_db_path": self.config.get("vector_store", {}).get(
                     "path", "./data/vector_db"
                 ),
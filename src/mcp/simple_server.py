@@ -404,6 +404,8 @@ class SimplePDFRAGMCPServer:
                 "embedding_model": self.config.get("embedding", {}).get(
                     "model", "sentence-transformers/all-MiniLM-L6-v2"
                 ),
+                "embedding_batch_size": self.config.get("embedding", {}).get("batch_size", 64),
+                "embedding_precision": self.config.get("embedding", {}).get("precision", "fp32"),
                 "vector_db_path": vector_db_path,
                 "collection_name": self.config.get("vector_store", {}).get(
                     "collection_name", "technical_docs"
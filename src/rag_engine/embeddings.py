@@ -4,6 +4,7 @@ This module provides embedding generation capabilities for technical documentati
 chunks using sentence transformers.
 """
 
+import functools
 import logging
 from typing import Any
 
@@ -12,17 +13,84 @@ from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
+# Number of single-text embeddings (typically queries) kept in memory
+EMBEDDING_CACHE_SIZE = 1024
+
+# Number of chunks encoded per forward pass
+EMBEDDING_BATCH_SIZE = 64
+
+# Chunk counts above this show a progress bar while encoding
+PROGRESS_BAR_THRESHOLD = 256
+
+# Supported model precisions; fp16 only takes effect on GPU devices
+EMBEDDING_PRECISIONS = ("fp32", "fp16")
+_HALF_PRECISION_DEVICES = ("cuda", "mps")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_sentence_transformer(model_name: str, precision: str = "fp32") -> SentenceTransformer:
+    """Load a sentence transformer model once per process and precision.
+
+    Args:
+        model_name: Name of the sentence transformer model
+        precision: "fp32", or "fp16" to cast the model to half precision
+            when it runs on a GPU
+
+    Returns:
+        Loaded model, shared by every EmbeddingGenerator using that name
+        and precision
+    """
+    model = SentenceTransformer(model_name)
+    if precision == "fp16" and model.device.type in _HALF_PRECISION_DEVICES:
+        model.half()
+    return model
+
+
+@functools.lru_cache(maxsize=EMBEDDING_CACHE_SIZE)
+def _encode_cached(model_name: str, precision: str, text: str) -> np.ndarray:
+    """Embed a single text, caching the result by model, precision and text.
+
+    Args:
+        model_name: Name of the sentence transformer model
+        precision: Model precision
+        text: Text to embed
+
+    Returns:
+        Read-only, unit-length embedding array
+    """
+    embedding = _load_sentence_transformer(model_name, precision).encode(
+        [text], normalize_embeddings=True, convert_to_numpy=True
+    )[0]
+    embedding.setflags(write=False)
+    return embedding
+
 
 class EmbeddingGenerator:
     """Generates embeddings for document chunks using sentence transformers."""
 
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+        precision: str = "fp32",
+    ):
         """Initialize the embedding generator.
 
         Args:
             model_name: Name of the sentence transformer model to use
+            batch_size: Number of chunks encoded per forward pass
+            precision: "fp32", or "fp16" to run the model in half
+                precision on CUDA/MPS devices; CPU always uses fp32
+
+        Raises:
+            ValueError: If precision is not supported
         """
+        if precision not in EMBEDDING_PRECISIONS:
+            raise ValueError(f"Unsupported embedding precision: {precision}")
+
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.precision = precision
         self.model = None
         self._load_model()
 
@@ -30,7 +98,7 @@ class EmbeddingGenerator:
         """Load the sentence transformer model."""
         try:
             logger.info(f"Loading embedding model: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name)
+            self.model = _load_sentence_transformer(self.model_name, self.precision)
             logger.info("Embedding model loaded successfully")
         except Exception as e:
             logger.error(f"Failed to load embedding model: {e}")
@@ -43,14 +111,20 @@ class EmbeddingGenerator:
             chunks: List of text chunks to embed
 
         Returns:
-            Numpy array of embeddings
+            Numpy array of unit-length embeddings
         """
         if not chunks:
             return np.array([])
 
         try:
             logger.debug(f"Generating embeddings for {len(chunks)} chunks")
-            embeddings = self.model.encode(chunks, show_progress_bar=True)
+            embeddings = self.model.encode(
+                chunks,
+                batch_size=self.batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=len(chunks) > PROGRESS_BAR_THRESHOLD,
+            )
             logger.debug(f"Generated embeddings shape: {embeddings.shape}")
             return embeddings
         except Exception as e:
@@ -64,11 +138,11 @@ class EmbeddingGenerator:
             text: Text to embed
 
         Returns:
-            Numpy array of embedding
+            Numpy array of unit-length embedding
         """
         try:
-            embedding = self.model.encode([text])
-            return embedding[0]
+            # Repeated texts (e.g. the same query) skip the model entirely
+            return _encode_cached(self.model_name, self.precision, text).copy()
         except Exception as e:
             logger.error(f"Failed to generate embedding: {e}")
             raise
@@ -114,6 +188,11 @@ class EmbeddingGenerator:
             Array of similarity scores
         """
         try:
+            # Work in float32; embeddings read back from the vector store
+            # arrive as Python lists and would otherwise become float64
+            query_embedding = np.asarray(query_embedding, dtype=np.float32)
+            chunk_embeddings = np.asarray(chunk_embeddings, dtype=np.float32)
+
             # Normalize query embedding
             query_norm = np.linalg.norm(query_embedding)
             if query_norm == 0:
@@ -121,13 +200,13 @@ class EmbeddingGenerator:
 
             normalized_query = query_embedding / query_norm
 
-            # Normalize chunk embeddings
+            # Compute cosine similarities with one matrix-vector product
+            similarities = np.dot(chunk_embeddings, normalized_query)
+            # Dividing the scores by the chunk norms is equivalent to
+            # normalizing the chunks, without an N x d temporary copy
             chunk_norms = np.linalg.norm(chunk_embeddings, axis=1)
             chunk_norms[chunk_norms == 0] = 1  # Avoid division by zero
-            normalized_chunks = chunk_embeddings / chunk_norms[:, np.newaxis]
-
-            # Compute cosine similarities
-            similarities = np.dot(normalized_chunks, normalized_query)
+            similarities /= chunk_norms
             return similarities
         except Exception as e:
             logger.error(f"Failed to compute batch similarity: {e}")
@@ -148,6 +227,9 @@ class EmbeddingGenerator:
                 "max_seq_length": getattr(self.model, "max_seq_length", "unknown"),
                 "embedding_dimension": self.model.get_sentence_embedding_dimension(),
                 "device": str(self.model.device),
+                "precision": self.precision,
+                "batch_size": self.batch_size,
+                "embedding_cache": _encode_cached.cache_info()._asdict(),
             }
         except Exception as e:
             logger.error(f"Failed to get model info: {e}")
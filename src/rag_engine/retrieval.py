@@ -4,12 +4,13 @@ This module provides the main RAG pipeline that combines document chunking,
 embedding generation, vector storage, and LLM integration.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any
 
-from .chunking import DocumentChunker
-from .embeddings import EmbeddingGenerator
+from .chunking import DocumentChunk, DocumentChunker
+from .embeddings import EMBEDDING_BATCH_SIZE, EmbeddingGenerator
 from .llm_integration import LLMIntegration, LLMResponse
 from .vector_store import VectorStore
 
@@ -33,12 +34,15 @@ class RAGEngine:
         )
 
         self.embedder = EmbeddingGenerator(
-            model_name=config.get("embedding_model", "sentence-transformers/all-MiniLM-L6-v2")
+            model_name=config.get("embedding_model", "sentence-transformers/all-MiniLM-L6-v2"),
+            batch_size=config.get("embedding_batch_size", EMBEDDING_BATCH_SIZE),
+            precision=config.get("embedding_precision", "fp32"),
         )
 
         self.vector_store = VectorStore(
             db_path=config.get("vector_db_path", "./data/vector_db"),
             collection_name=config.get("collection_name", "technical_docs"),
+            embedder=self.embedder,
         )
 
         self.llm = LLMIntegration(
@@ -92,6 +96,26 @@ class RAGEngine:
             logger.error(f"Failed to process document: {e}")
             return False
 
+    def _no_results_response(self) -> LLMResponse:
+        """Build the response for a query that retrieved no chunks."""
+        logger.warning("No relevant chunks found for query")
+        return LLMResponse(
+            answer="I couldn't find any relevant information in the knowledge base for your question.",
+            sources=[],
+            confidence=0.0,
+            model_used=self.llm.model_name,
+        )
+
+    def _error_response(self, error: Exception) -> LLMResponse:
+        """Build the response for a query that failed with ``error``."""
+        logger.error(f"Failed to process query: {error}")
+        return LLMResponse(
+            answer=f"Error processing your question: {str(error)}",
+            sources=[],
+            confidence=0.0,
+            model_used=self.llm.model_name,
+        )
+
     def query(
         self, question: str, top_k: int = 5, filter_dict: dict[str, Any] | None = None
     ) -> LLMResponse:
@@ -112,13 +136,7 @@ class RAGEngine:
             relevant_chunks, sources = self.vector_store.search(question, top_k, filter_dict)
 
             if not relevant_chunks:
-                logger.warning("No relevant chunks found for query")
-                return LLMResponse(
-                    answer="I couldn't find any relevant information in the knowledge base for your question.",
-                    sources=[],
-                    confidence=0.0,
-                    model_used=self.llm.model_name,
-                )
+                return self._no_results_response()
 
             logger.debug(f"Retrieved {len(relevant_chunks)} relevant chunks")
 
@@ -129,14 +147,48 @@ class RAGEngine:
             return response
 
         except Exception as e:
-            logger.error(f"Failed to process query: {e}")
-            return LLMResponse(
-                answer=f"Error processing your question: {str(e)}",
-                sources=[],
-                confidence=0.0,
-                model_used=self.llm.model_name,
+            return self._error_response(e)
+
+    async def aquery(
+        self, question: str, top_k: int = 5, filter_dict: dict[str, Any] | None = None
+    ) -> LLMResponse:
+        """Query the knowledge base without blocking the event loop.
+
+        Same pipeline as ``query``, but the vector search and the LLM call
+        each run in a worker thread.
+
+        Args:
+            question: User question
+            top_k: Number of relevant chunks to retrieve
+            filter_dict: Optional metadata filters
+
+        Returns:
+            LLMResponse with answer and metadata
+        """
+        try:
+            logger.info(f"Processing query: {question}")
+
+            # Step 1: Retrieve relevant chunks
+            relevant_chunks, sources = await asyncio.to_thread(
+                self.vector_store.search, question, top_k, filter_dict
             )
 
+            if not relevant_chunks:
+                return self._no_results_response()
+
+            logger.debug(f"Retrieved {len(relevant_chunks)} relevant chunks")
+
+            # Step 2: Generate LLM response
+            response = await asyncio.to_thread(
+                self.llm.generate_response, question, relevant_chunks, sources
+            )
+
+            logger.info(f"Generated response with confidence: {response.confidence:.2f}")
+            return response
+
+        except Exception as e:
+            return self._error_response(e)
+
     def add_pdf_document(self, pdf_path: Path, document_type: str = "unknown") -> bool:
         """Add a PDF document to the knowledge base.
 
@@ -148,35 +200,176 @@ class RAGEngine:
             True if successful, False otherwise
         """
         try:
-            # Import here to avoid circular imports
-            from pdf_extractor import process_pdf_file
+            converted = self._convert_pdf(pdf_path, document_type)
+            if converted is None:
+                return False
 
-            # Convert PDF to markdown
-            output_path = Path("md") / f"{pdf_path.stem}.md"
-            success, error = process_pdf_file(pdf_path, output_path)
+            # Process through RAG pipeline
+            markdown_content, metadata = converted
+            return self.process_document(markdown_content, metadata)
 
-            if not success:
-                logger.error(f"Failed to convert PDF: {error}")
-                return False
+        except Exception as e:
+            logger.error(f"Failed to add PDF document: {e}")
+            return False
 
-            # Read markdown content
-            markdown_content = output_path.read_text(encoding="utf-8")
+    def prepare_pdf_document(
+        self, pdf_path: Path, document_type: str = "unknown"
+    ) -> list[DocumentChunk] | None:
+        """Convert and chunk a PDF without embedding or storing it.
 
-            # Prepare metadata
-            metadata = {
-                "document": pdf_path.name,
-                "type": document_type,
-                "source": str(pdf_path),
-                "file_path": str(output_path),
-            }
+        Conversion is the slow, per-file step, so callers can prepare several
+        PDFs concurrently and hand the chunks to ``add_document_chunks``.
 
-            # Process through RAG pipeline
+        Args:
+            pdf_path: Path to the PDF file
+            document_type: Type of document
+
+        Returns:
+            Chunks of the document, or None if conversion or chunking failed
+        """
+        try:
+            converted = self._convert_pdf(pdf_path, document_type)
+            if converted is None:
+                return None
+            markdown_content, metadata = converted
+            chunks = self.chunker.chunk_by_sections(markdown_content, metadata)
+            if not chunks:
+                logger.warning(f"No chunks created from document: {pdf_path.name}")
+                return None
+            return chunks
+
+        except Exception as e:
+            logger.error(f"Failed to prepare PDF document {pdf_path.name}: {e}")
+            return None
+
+    def add_document_chunks(self, documents: list[list[DocumentChunk]]) -> list[bool]:
+        """Embed and store the chunks of several documents in one batch.
+
+        Chunks from all documents are embedded with a single call so the
+        embedding model can batch across documents.
+
+        Args:
+            documents: Chunks of each document, as from ``prepare_pdf_document``
+
+        Returns:
+            List of success flags, one per document
+        """
+        results = [False] * len(documents)
+        if not documents:
+            return results
+
+        # Step 1: Generate embeddings for all chunks at once
+        chunk_texts = [chunk.content for chunks in documents for chunk in chunks]
+        try:
+            embeddings = self.embedder.generate_embeddings(chunk_texts)
+        except Exception as e:
+            logger.error(f"Failed to generate embeddings for batch: {e}")
+            return results
+        logger.debug(f"Generated embeddings for batch: {embeddings.shape}")
+
+        # Step 2: Store each document's slice so failures stay per document
+        offset = 0
+        for index, chunks in enumerate(documents):
+            end = offset + len(chunks)
+            results[index] = self.vector_store.store_embeddings(
+                chunk_texts[offset:end],
+                embeddings[offset:end],
+                [chunk.metadata for chunk in chunks],
+            )
+            offset = end
+
+        logger.info(
+            f"Batch added {sum(results)} of {len(documents)} documents "
+            f"({len(chunk_texts)} chunks)"
+        )
+        return results
+
+    @staticmethod
+    def markdown_path(pdf_path: Path) -> Path:
+        """Get the path the markdown conversion of a PDF is written to.
+
+        Args:
+            pdf_path: Path to the PDF file
+
+        Returns:
+            Path of the converted markdown file
+        """
+        return Path("md") / f"{pdf_path.stem}.md"
+
+    def add_converted_pdf_document(self, pdf_path: Path, document_type: str = "unknown") -> bool:
+        """Add a PDF document whose markdown has already been written.
+
+        Used when conversion runs elsewhere (e.g. in a worker process) and
+        has written its output to ``markdown_path(pdf_path)``.
+
+        Args:
+            pdf_path: Path to the PDF file
+            document_type: Type of document
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            markdown_content, metadata = self._read_converted_pdf(
+                pdf_path, self.markdown_path(pdf_path), document_type
+            )
             return self.process_document(markdown_content, metadata)
 
         except Exception as e:
             logger.error(f"Failed to add PDF document: {e}")
             return False
 
+    def _convert_pdf(
+        self, pdf_path: Path, document_type: str
+    ) -> tuple[str, dict[str, Any]] | None:
+        """Convert a PDF to markdown and build its document metadata.
+
+        Args:
+            pdf_path: Path to the PDF file
+            document_type: Type of document
+
+        Returns:
+            Tuple of (markdown content, metadata), or None if conversion failed
+        """
+        # Import here to avoid circular imports
+        from pdf_extractor.converter import process_pdf_file
+
+        # Convert PDF to markdown
+        output_path = self.markdown_path(pdf_path)
+        success, error = process_pdf_file(pdf_path, output_path)
+
+        if not success:
+            logger.error(f"Failed to convert PDF: {error}")
+            return None
+
+        return self._read_converted_pdf(pdf_path, output_path, document_type)
+
+    @staticmethod
+    def _read_converted_pdf(
+        pdf_path: Path, output_path: Path, document_type: str
+    ) -> tuple[str, dict[str, Any]]:
+        """Read a converted PDF's markdown and build its document metadata.
+
+        Args:
+            pdf_path: Path to the PDF file
+            output_path: Path of the converted markdown file
+            document_type: Type of document
+
+        Returns:
+            Tuple of (markdown content, metadata)
+        """
+        # Read markdown content
+        markdown_content = output_path.read_text(encoding="utf-8")
+
+        # Prepare metadata
+        metadata = {
+            "document": pdf_path.name,
+            "type": document_type,
+            "source": str(pdf_path),
+            "file_path": str(output_path),
+        }
+        return markdown_content, metadata
+
     def list_documents(self) -> list[dict[str, Any]]:
         """List all documents in the knowledge base.
 
@@ -185,6 +378,26 @@ class RAGEngine:
         """
         return self.vector_store.list_documents()
 
+    def list_documents_page(self, offset: int = 0, limit: int = 100) -> list[dict[str, Any]]:
+        """List one page of documents in the knowledge base.
+
+        Args:
+            offset: Number of documents to skip
+            limit: Maximum number of documents to return
+
+        Returns:
+            List of document metadata
+        """
+        return self.vector_store.list_documents_page(offset, limit)
+
+    def count_documents(self) -> tuple[int, int]:
+        """Count documents and chunks in the knowledge base.
+
+        Returns:
+            Tuple of (document count, chunk count)
+        """
+        return self.vector_store.count_documents()
+
     def delete_document(self, document_name: str) -> bool:
         """Delete a document from the knowledge base.
 
@@ -9,30 +9,51 @@ import logging
 import re
 import unicodedata
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import chromadb
 import numpy as np
 from chromadb.config import Settings
 
+if TYPE_CHECKING:
+    from .embeddings import EmbeddingGenerator
+
 logger = logging.getLogger(__name__)
 
 # Constants
 CHROMADB_BATCH_LIMIT = 1000  # ChromaDB's documented limit for get/delete operations
 
+# HNSW index settings applied when a collection is created. Cosine matches
+# how embeddings are compared elsewhere; a wider graph (M) and candidate
+# lists (ef) keep approximate search recall close to an exact scan.
+HNSW_INDEX_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64,
+}
+
 
 class VectorStore:
     """Vector database for storing and retrieving document embeddings."""
 
-    def __init__(self, db_path: str = "./data/vector_db", collection_name: str = "technical_docs"):
+    def __init__(
+        self,
+        db_path: str = "./data/vector_db",
+        collection_name: str = "technical_docs",
+        embedder: "EmbeddingGenerator | None" = None,
+    ):
         """Initialize the vector store.
 
         Args:
             db_path: Path to the vector database
             collection_name: Name of the collection to use
+            embedder: Generator for query embeddings; a default one is
+                created on first search if not given
         """
         self.db_path = Path(db_path)
         self.collection_name = collection_name
+        self.embedder = embedder
         self.client = None
         self.collection = None
         self._initialize_db()
@@ -55,7 +76,10 @@ class VectorStore:
             except Exception:
                 self.collection = self.client.create_collection(
                     name=self.collection_name,
-                    metadata={"description": "Technical documentation embeddings"},
+                    metadata={
+                        "description": "Technical documentation embeddings",
+                        **HNSW_INDEX_METADATA,
+                    },
                 )
                 logger.info(f"Created new collection: {self.collection_name}")
 
@@ -128,10 +152,11 @@ class VectorStore:
         """
         try:
             # Generate query embedding
-            from .embeddings import EmbeddingGenerator
+            if self.embedder is None:
+                from .embeddings import EmbeddingGenerator
 
-            embedder = EmbeddingGenerator()
-            query_embedding = embedder.generate_embedding(query)
+                self.embedder = EmbeddingGenerator()
+            query_embedding = self.embedder.generate_embedding(query)
 
             # Search in ChromaDB
             results = self.collection.query(
@@ -217,8 +242,10 @@ class VectorStore:
             offset = 0
 
             while True:
-                # Get a batch of results
-                results = self.collection.get(limit=batch_size, offset=offset)
+                # Get a batch of results; only metadata is needed, not chunk text
+                results = self.collection.get(
+                    limit=batch_size, offset=offset, include=["metadatas"]
+                )
 
                 # Check if we got any results
                 batch_ids = results.get("ids", [])
@@ -263,6 +290,94 @@ class VectorStore:
             logger.error(f"Failed to list documents: {e}")
             return []
 
+    def list_documents_page(self, offset: int = 0, limit: int = 100) -> list[dict[str, Any]]:
+        """List one page of unique documents in the collection.
+
+        Pages over each document's first chunk (chunk_index 0) so the query
+        returns one row per document, then counts chunks for just that
+        page. Unlike list_documents, memory use is bounded by the page size.
+
+        Args:
+            offset: Number of documents to skip
+            limit: Maximum number of documents to return (max 1000)
+
+        Returns:
+            List of document metadata, in collection order
+        """
+        try:
+            limit = min(limit, CHROMADB_BATCH_LIMIT)
+            results = self.collection.get(
+                where={"chunk_index": 0}, limit=limit, offset=offset, include=["metadatas"]
+            )
+            documents = {}
+            for metadata in results.get("metadatas", []):
+                doc_name = metadata.get("document", "unknown")
+                documents[doc_name] = {
+                    "document": doc_name,
+                    "type": metadata.get("type", "unknown"),
+                    "chunk_count": 0,
+                    "source": metadata.get("source", "unknown"),
+                }
+            if not documents:
+                return []
+
+            # Count chunks of this page's documents only
+            chunk_offset = 0
+            while True:
+                chunks = self.collection.get(
+                    where={"document": {"$in": list(documents)}},
+                    limit=CHROMADB_BATCH_LIMIT,
+                    offset=chunk_offset,
+                    include=["metadatas"],
+                )
+                batch = chunks.get("metadatas", [])
+                for metadata in batch:
+                    doc_name = metadata.get("document", "unknown")
+                    if doc_name in documents:
+                        documents[doc_name]["chunk_count"] += 1
+                if len(batch) < CHROMADB_BATCH_LIMIT:
+                    break
+                chunk_offset += len(batch)
+
+            return list(documents.values())
+
+        except Exception as e:
+            logger.error(f"Failed to list documents: {e}")
+            return []
+
+    def count_documents(self, batch_size: int = CHROMADB_BATCH_LIMIT) -> tuple[int, int]:
+        """Count unique documents and chunks in the collection.
+
+        Cheaper than list_documents: the chunk total comes from count(), and
+        only metadata is fetched to find the unique document names.
+
+        Args:
+            batch_size: Number of chunks to retrieve per batch (max 1000)
+
+        Returns:
+            Tuple of (document count, chunk count)
+        """
+        try:
+            chunk_count = self.collection.count()
+            if chunk_count == 0:
+                return 0, 0
+
+            batch_size = min(batch_size, CHROMADB_BATCH_LIMIT)
+            document_names = set()
+            for offset in range(0, chunk_count, batch_size):
+                results = self.collection.get(
+                    limit=batch_size, offset=offset, include=["metadatas"]
+                )
+                document_names.update(
+                    metadata.get("document", "unknown") for metadata in results.get("metadatas", [])
+                )
+
+            return len(document_names), chunk_count
+
+        except Exception as e:
+            logger.error(f"Failed to count documents: {e}")
+            return 0, 0
+
     def clear_collection(self) -> bool:
         """Clear all documents from the collection atomically.
 
@@ -317,7 +432,10 @@ class VectorStore:
             self.client.delete_collection(self.collection_name)
             self.collection = self.client.create_collection(
                 name=self.collection_name,
-                metadata={"description": "Technical documentation embeddings"},
+                metadata={
+                    "description": "Technical documentation embeddings",
+                    **HNSW_INDEX_METADATA,
+                },
             )
             logger.info(f"Reset collection: {self.collection_name}")
             return True
@@ -0,0 +1,152 @@
+"""Tests for rate limiting, token decoding and user caching in src.mcp.auth."""
+
+import asyncio
+import hashlib
+import os
+
+import pytest
+
+pytest.importorskip("bcrypt")
+pytest.importorskip("cachetools")
+pytest.importorskip("fastapi")
+pytest.importorskip("jose")
+
+# auth refuses to import without a signing key
+os.environ.setdefault("JWT_SECRET_KEY", "unit-test-secret")
+
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from jose import jwt
+
+from src.mcp import auth
+
+WINDOW = auth.RATE_LIMIT_WINDOW_SECONDS
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable monotonic clock, starting at the beginning of a window."""
+    now = [WINDOW * 10]
+    monkeypatch.setattr(auth.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    """Reset module-level state shared between tests."""
+    auth.rate_limit_storage.clear()
+    auth._user_obj_cache.clear()
+    auth._jwt_cache.clear()
+    yield
+    auth.rate_limit_storage.clear()
+    auth._user_obj_cache.clear()
+    auth._jwt_cache.clear()
+
+
+class TestCheckRateLimit:
+    """Tests for the approximate sliding-window rate limiter."""
+
+    def test_requests_up_to_limit_are_allowed(self, clock):
+        assert all(auth.check_rate_limit("alice", limit=5) for _ in range(5))
+
+    def test_request_over_limit_is_denied(self, clock):
+        for _ in range(5):
+            auth.check_rate_limit("alice", limit=5)
+        assert auth.check_rate_limit("alice", limit=5) is False
+
+    def test_denied_requests_are_not_counted(self, clock):
+        for _ in range(8):
+            auth.check_rate_limit("alice", limit=5)
+        assert auth.rate_limit_storage["alice"]["cur"] == 5
+
+    def test_identifiers_are_limited_independently(self, clock):
+        for _ in range(5):
+            auth.check_rate_limit("alice", limit=5)
+        assert auth.check_rate_limit("bob", limit=5) is True
+
+    def test_previous_window_weighs_less_as_time_passes(self, clock):
+        for _ in range(10):
+            auth.check_rate_limit("alice", limit=10)
+
+        # Right after the window rolls, the previous window still counts fully
+        clock[0] += WINDOW
+        assert auth.check_rate_limit("alice", limit=10) is False
+
+        # Halfway through, half of it counts: 5 + 0 < 10 allows 5 more
+        clock[0] += WINDOW // 2
+        allowed = sum(auth.check_rate_limit("alice", limit=10) for _ in range(10))
+        assert allowed == 5
+
+    def test_limit_refills_after_two_idle_windows(self, clock):
+        for _ in range(10):
+            auth.check_rate_limit("alice", limit=10)
+        clock[0] += 2 * WINDOW
+        assert all(auth.check_rate_limit("alice", limit=10) for _ in range(10))
+        assert auth.check_rate_limit("alice", limit=10) is False
+
+    def test_least_recently_used_identifier_is_evicted(self, clock, monkeypatch):
+        monkeypatch.setattr(auth, "RATE_LIMIT_MAX_TRACKED", 2)
+        auth.check_rate_limit("alice")
+        auth.check_rate_limit("bob")
+        auth.check_rate_limit("alice")
+        auth.check_rate_limit("carol")
+        assert list(auth.rate_limit_storage) == ["alice", "carol"]
+
+
+class TestDecodeToken:
+    """Tests for JWT verification."""
+
+    def test_valid_token_is_decoded(self):
+        token = auth.create_access_token({"sub": "alice"})
+        assert auth.decode_token(token)["sub"] == "alice"
+
+    def test_other_algorithm_is_rejected(self):
+        token = jwt.encode({"sub": "alice", "exp": 2**31}, auth.SECRET_KEY, algorithm="HS384")
+        with pytest.raises(HTTPException) as exc_info:
+            auth.decode_token(token)
+        assert exc_info.value.status_code == 401
+
+    def test_wrong_key_is_rejected(self):
+        token = jwt.encode({"sub": "alice", "exp": 2**31}, "other-secret", algorithm="HS256")
+        with pytest.raises(HTTPException):
+            auth.decode_token(token)
+
+    def test_expired_token_is_rejected(self):
+        token = jwt.encode({"sub": "alice", "exp": 1}, auth.SECRET_KEY, algorithm="HS256")
+        with pytest.raises(HTTPException):
+            auth.decode_token(token)
+
+
+class TestUserCache:
+    """Tests for the constructed User cache."""
+
+    def test_jwt_user_and_api_key_with_same_name_do_not_share_entries(self, monkeypatch):
+        # A demo user whose name matches the synthetic name of an API-key user
+        monkeypatch.setitem(auth._DEMO_USERS, "api_key_svc", {
+            "username": "api_key_svc",
+            "is_active": True,
+            "is_admin": True,
+        })
+        key_data = {"name": "svc", "is_active": True, "rate_limit": 100}
+        monkeypatch.setattr(
+            auth, "API_KEY_HASHES", {hashlib.sha256(b"svc-key").digest(): key_data}
+        )
+        credentials = HTTPAuthorizationCredentials(
+            scheme="Bearer", credentials=auth.create_access_token({"sub": "api_key_svc"})
+        )
+
+        jwt_user = asyncio.run(auth.get_current_user_jwt(credentials))
+        key_user = asyncio.run(auth.get_current_user_api_key("svc-key"))
+
+        assert jwt_user.is_admin is True
+        assert key_user.username == "api_key_svc"
+        assert key_user.is_admin is False
+
+    def test_user_objects_are_reused(self, monkeypatch):
+        key_data = {"name": "svc", "is_active": True, "rate_limit": 100}
+        monkeypatch.setattr(
+            auth, "API_KEY_HASHES", {hashlib.sha256(b"svc-key").digest(): key_data}
+        )
+        first = asyncio.run(auth.get_current_user_api_key("svc-key"))
+        second = asyncio.run(auth.get_current_user_api_key("svc-key"))
+        assert first is second
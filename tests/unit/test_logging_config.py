@@ -0,0 +1,101 @@
+"""Tests for log message sanitization in src.mcp.logging_config."""
+
+import logging
+
+import pytest
+
+pytest.importorskip("yaml")
+pytest.importorskip("orjson")
+
+from src.mcp.logging_config import _SanitizeFilter, sanitize_log_message
+
+
+def make_record(msg, args=None) -> logging.LogRecord:
+    """Build a log record as Logger.makeRecord would."""
+    return logging.LogRecord(
+        name="test", level=logging.INFO, pathname=__file__, lineno=1,
+        msg=msg, args=args, exc_info=None,
+    )
+
+
+class TestSanitizeLogMessage:
+    """Tests for sanitize_log_message."""
+
+    def test_printable_message_is_unchanged(self):
+        message = "Query processed - Confidence: 0.93, Sources: 4"
+        assert sanitize_log_message(message) is message
+
+    def test_newlines_are_escaped(self):
+        assert sanitize_log_message("line1\nline2\r\n") == "line1\\nline2\\r\\n"
+
+    def test_other_control_characters_are_removed(self):
+        assert sanitize_log_message("a\x00b\x1bc\x7fd\x85e\tf") == "abcdef"
+
+    def test_non_ascii_text_is_kept(self):
+        assert sanitize_log_message("ドキュメント ✅") == "ドキュメント ✅"
+
+
+class TestSanitizeFilter:
+    """Tests for the filter installed on the queue handler."""
+
+    def test_forged_log_line_is_neutralized(self):
+        record = make_record("User %s logged in", ("bob\n2024-01-01 - ERROR - forged",))
+        assert _SanitizeFilter().filter(record) is True
+        assert record.getMessage() == "User bob\\n2024-01-01 - ERROR - forged logged in"
+
+    def test_args_are_merged_with_their_types(self):
+        record = make_record("%d chunks in %.1fs", (12, 0.25))
+        _SanitizeFilter().filter(record)
+        assert record.args is None
+        assert record.msg == "12 chunks in 0.2s"
+
+    def test_non_string_message_is_converted(self):
+        record = make_record(ValueError("bad\ninput"))
+        _SanitizeFilter().filter(record)
+        assert record.msg == "bad\\ninput"
+
+    def test_printable_message_without_args_is_untouched(self):
+        message = "Starting PDF RAG HTTP Server..."
+        record = make_record(message)
+        _SanitizeFilter().filter(record)
+        assert record.msg is message
+
+    def test_filter_applies_to_records_from_child_loggers(self):
+        records = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        parent = logging.getLogger("test_sanitize_parent")
+        parent.propagate = False
+        handler = ListHandler()
+        handler.addFilter(_SanitizeFilter())
+        parent.addHandler(handler)
+        try:
+            logging.getLogger("test_sanitize_parent.child").warning("a\nb %s", "c\rd")
+        finally:
+            parent.removeHandler(handler)
+
+        assert [r.getMessage() for r in records] == ["a\\nb c\\rd"]
+
+    def test_mismatched_format_does_not_raise_in_caller(self):
+        record = make_record("%d items", ("abc",))
+        assert _SanitizeFilter().filter(record) is True
+        assert record.msg == "%d items"
+        assert record.args == ("abc",)
+
+    def test_mismatched_format_is_reported_by_handler(self, capsys, monkeypatch):
+        monkeypatch.setattr(logging, "raiseExceptions", True)
+        lg = logging.getLogger("test_sanitize_bad_format")
+        lg.propagate = False
+        handler = logging.StreamHandler()
+        lg.addHandler(handler)
+        lg.addFilter(_SanitizeFilter())
+        try:
+            lg.error("%d items", "abc")
+        finally:
+            lg.removeHandler(handler)
+            lg.filters.clear()
+
+        assert "--- Logging error ---" in capsys.readouterr().err
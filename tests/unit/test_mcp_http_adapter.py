@@ -0,0 +1,318 @@
+"""Tests for answer caching and JSON-RPC batching in src.mcp.mcp_http_adapter."""
+
+import asyncio
+import zlib
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+orjson = pytest.importorskip("orjson")
+pytest.importorskip("fastapi")
+
+from src.mcp import mcp_http_adapter
+from src.mcp.mcp_http_adapter import MCPHTTPAdapter, _SemanticAnswerCache
+
+
+class FakeRAGEngine:
+    """RAG engine double that answers from a fixed source and counts queries."""
+
+    def __init__(self):
+        self.query_count = 0
+        self.embed_count = 0
+        self.cleared = False
+        self.documents = []
+        self.page_calls = []
+        self.embedder = SimpleNamespace(generate_embedding=self._embed)
+        self.vector_store = SimpleNamespace(clear_collection=self._clear)
+        # Fixed embeddings for specific questions, set by tests
+        self.embeddings = {}
+        # Set by tests to run code while a query is in flight
+        self.during_query = None
+
+    def _embed(self, text: str):
+        self.embed_count += 1
+        if text in self.embeddings:
+            return np.asarray(self.embeddings[text], dtype=np.float32)
+        # Questions differing only in case or punctuation embed identically
+        vector = np.zeros(64, dtype=np.float32)
+        for word in "".join(c for c in text.lower() if c.isalnum() or c == " ").split():
+            vector[zlib.crc32(word.encode()) % 64] += 1.0
+        return vector
+
+    def _clear(self) -> bool:
+        self.cleared = True
+        return True
+
+    def query(self, question: str, top_k: int):
+        self.query_count += 1
+        if self.during_query is not None:
+            self.during_query()
+        return SimpleNamespace(
+            answer=f"answer {self.query_count}",
+            confidence=0.9,
+            sources=[{"document": "manual.pdf", "page": 3}],
+        )
+
+    def count_documents(self):
+        return 1, 10
+
+    def list_documents_page(self, offset: int, limit: int):
+        self.page_calls.append((offset, limit))
+        return self.documents[offset:offset + limit]
+
+
+class FakeRequest:
+    """Minimal stand-in for a FastAPI request carrying a JSON body."""
+
+    def __init__(self, body, headers=None):
+        self._body = body if isinstance(body, bytes) else orjson.dumps(body)
+        self.headers = headers or {}
+
+    async def body(self) -> bytes:
+        return self._body
+
+
+def query_call(question: str, request_id=1) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {
+            "name": "pdfrag.query_technical_docs",
+            "arguments": {"question": question},
+        },
+    }
+
+
+def ask(adapter: MCPHTTPAdapter, question: str) -> str:
+    result = asyncio.run(adapter.call_tool(
+        "pdfrag.query_technical_docs", {"question": question}
+    ))
+    return result["content"][0]["text"]
+
+
+def stream_documents(adapter: MCPHTTPAdapter) -> str:
+    async def collect():
+        response = await adapter.handle_documents_stream()
+        return "".join([chunk async for chunk in response.body_iterator])
+    return asyncio.run(collect())
+
+
+def post(adapter: MCPHTTPAdapter, body):
+    response = asyncio.run(adapter.handle_mcp_request(FakeRequest(body)))
+    return orjson.loads(response.body)
+
+
+@pytest.fixture
+def engine():
+    return FakeRAGEngine()
+
+
+@pytest.fixture
+def adapter(engine):
+    return MCPHTTPAdapter(engine)
+
+
+@pytest.fixture
+def semantic_adapter(engine):
+    return MCPHTTPAdapter(engine, semantic_cache=True)
+
+
+class TestAnswerCacheInvalidation:
+    """Cached answers must not outlive a change to the knowledge base."""
+
+    def test_repeated_question_is_served_from_cache(self, adapter, engine):
+        first = ask(adapter, "How do I reset the modem?")
+        second = ask(adapter, "  How do I reset the modem?\n")
+        assert first == second
+        assert engine.query_count == 1
+
+    def test_invalidate_drops_exact_and_semantic_answers(self, semantic_adapter, engine):
+        ask(semantic_adapter, "How do I reset the modem?")
+        semantic_adapter.invalidate_answer_caches()
+
+        # Neither the exact question nor a near-duplicate may hit a cache
+        assert "answer 2" in ask(semantic_adapter, "How do I reset the modem?")
+        semantic_adapter.invalidate_answer_caches()
+        assert "answer 3" in ask(semantic_adapter, "How do I reset the modem")
+        assert engine.query_count == 3
+
+    def test_clear_database_tool_invalidates(self, adapter, engine):
+        ask(adapter, "How do I reset the modem?")
+        result = asyncio.run(adapter.call_tool("pdfrag.clear_database", {"confirm": True}))
+        assert "isError" not in result or not result["isError"]
+        assert engine.cleared
+
+        ask(adapter, "How do I reset the modem?")
+        assert engine.query_count == 2
+
+    def test_answer_computed_during_corpus_change_is_not_cached(self, adapter, engine):
+        engine.during_query = adapter.invalidate_answer_caches
+        ask(adapter, "How do I reset the modem?")
+        engine.during_query = None
+
+        ask(adapter, "How do I reset the modem?")
+        assert engine.query_count == 2
+
+
+class TestSemanticAnswerCache:
+    """Tests for the embedding-similarity answer cache."""
+
+    def test_similar_question_hits_and_other_top_k_misses(self):
+        cache = _SemanticAnswerCache(max_size=4, threshold=0.95)
+        cache.put(np.array([1.0, 0.0, 0.0]), 5, "cached")
+        assert cache.get(np.array([0.99, 0.01, 0.0]), 5) == "cached"
+        assert cache.get(np.array([0.99, 0.01, 0.0]), 3) is None
+        assert cache.get(np.array([0.0, 1.0, 0.0]), 5) is None
+
+    def test_clear_empties_cache(self):
+        cache = _SemanticAnswerCache(max_size=4, threshold=0.95)
+        cache.put(np.array([1.0, 0.0]), 5, "cached")
+        cache.clear()
+        assert cache.get(np.array([1.0, 0.0]), 5) is None
+
+    def test_oldest_entry_is_overwritten_when_full(self):
+        cache = _SemanticAnswerCache(max_size=2, threshold=0.95)
+        cache.put(np.array([1.0, 0.0, 0.0]), 5, "first")
+        cache.put(np.array([0.0, 1.0, 0.0]), 5, "second")
+        cache.put(np.array([0.0, 0.0, 1.0]), 5, "third")
+        assert cache.get(np.array([1.0, 0.0, 0.0]), 5) is None
+        assert cache.get(np.array([0.0, 1.0, 0.0]), 5) == "second"
+        assert cache.get(np.array([0.0, 0.0, 1.0]), 5) == "third"
+
+
+class TestAnswerCacheMatching:
+    """Different questions must not share an answer."""
+
+    def test_exact_cache_is_case_sensitive(self, adapter, engine):
+        ask(adapter, "What does AT+QCFG=\"band\" return?")
+        ask(adapter, "What does AT+qcfg=\"BAND\" return?")
+        assert engine.query_count == 2
+
+    def test_semantic_cache_is_off_by_default(self, adapter, engine):
+        ask(adapter, "How do I reset the modem?")
+        ask(adapter, "How do I reset the modem")
+        assert engine.query_count == 2
+        assert engine.embed_count == 0
+
+    def test_similar_but_different_question_misses(self, semantic_adapter, engine):
+        # Cosine similarity 0.96: close enough to hit the old 0.95 threshold
+        engine.embeddings = {
+            "What is the maximum supply voltage?": [1.0, 0.0],
+            "What is the minimum supply voltage?": [0.96, 0.28],
+        }
+        first = ask(semantic_adapter, "What is the maximum supply voltage?")
+        second = ask(semantic_adapter, "What is the minimum supply voltage?")
+        assert first != second
+        assert engine.query_count == 2
+
+    def test_reworded_question_hits_when_enabled(self, semantic_adapter, engine):
+        engine.embeddings = {
+            "How do I reset the modem?": [1.0, 0.0],
+            "How can I reset the modem?": [0.999, 0.01],
+        }
+        first = ask(semantic_adapter, "How do I reset the modem?")
+        second = ask(semantic_adapter, "How can I reset the modem?")
+        assert first == second
+        assert engine.query_count == 1
+
+
+class TestBatchHandling:
+    """Tests for JSON-RPC single and batch requests."""
+
+    def test_single_request(self, adapter):
+        response = post(adapter, {"jsonrpc": "2.0", "id": 7, "method": "tools/list"})
+        assert response["id"] == 7
+        assert response["result"]["tools"]
+
+    def test_parse_error(self, adapter):
+        response = post(adapter, b"{not json")
+        assert response["error"]["code"] == -32700
+
+    def test_empty_batch_is_invalid(self, adapter):
+        response = post(adapter, [])
+        assert response["error"]["code"] == -32600
+        assert response["id"] is None
+
+    def test_oversized_batch_is_rejected(self, adapter, engine):
+        batch = [query_call(f"question {i}", i) for i in range(mcp_http_adapter.MAX_BATCH_SIZE + 1)]
+        response = post(adapter, batch)
+        assert response["error"]["code"] == -32600
+        assert engine.query_count == 0
+
+    def test_batch_of_invalid_items_returns_one_error_each(self, adapter):
+        response = post(adapter, [1, "x", {"id": 3}, {"id": 4, "method": "tools/call", "params": []}])
+        assert len(response) == 4
+        assert [item["error"]["code"] for item in response] == [-32600] * 4
+        assert [item["id"] for item in response] == [None] * 4
+
+    def test_notifications_get_no_response(self, adapter):
+        response = post(adapter, [
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+            {"jsonrpc": "2.0", "method": "tools/list"},
+        ])
+        assert len(response) == 1
+        assert response[0]["id"] == 1
+
+    def test_only_notifications_are_accepted_without_body(self, adapter):
+        for body in (
+            {"jsonrpc": "2.0", "method": "notifications/initialized"},
+            [{"jsonrpc": "2.0", "method": "notifications/initialized"}],
+        ):
+            response = asyncio.run(adapter.handle_mcp_request(FakeRequest(body)))
+            assert response.status_code == 202
+            assert response.body == b""
+
+    def test_mixed_batch_keeps_request_order(self, adapter):
+        response = post(adapter, [
+            {"jsonrpc": "2.0", "id": "a", "method": "initialize"},
+            {"jsonrpc": "2.0", "id": "b", "method": "no/such/method"},
+            42,
+            query_call("How do I reset the modem?", "d"),
+        ])
+        assert [item["id"] for item in response] == ["a", "b", None, "d"]
+        assert "result" in response[0]
+        assert response[1]["error"]["code"] == -32601
+        assert response[2]["error"]["code"] == -32600
+        assert "answer 1" in response[3]["result"]["content"][0]["text"]
+
+    def test_batch_concurrency_is_bounded(self, adapter, monkeypatch):
+        monkeypatch.setattr(mcp_http_adapter, "BATCH_CONCURRENCY", 2)
+        active = 0
+        peak = 0
+
+        async def slow_message(body):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return orjson.dumps({"jsonrpc": "2.0", "id": body["id"], "result": {}})
+
+        monkeypatch.setattr(adapter, "_handle_message", slow_message)
+        response = post(adapter, [{"id": i, "method": "tools/list"} for i in range(6)])
+        assert [item["id"] for item in response] == list(range(6))
+        assert peak == 2
+
+
+class TestDocumentStream:
+    """Tests for the paged markdown document list."""
+
+    def test_documents_are_fetched_one_page_at_a_time(self, adapter, engine, monkeypatch):
+        monkeypatch.setattr(mcp_http_adapter, "DOCUMENT_STREAM_BATCH_SIZE", 2)
+        engine.documents = [
+            {"document": f"doc{i}.pdf", "type": "manual", "chunk_count": i, "source": "s"}
+            for i in range(5)
+        ]
+        text = stream_documents(adapter)
+        assert text.startswith("**Documents in Knowledge Base**")
+        assert [line for line in text.splitlines() if line.startswith("- **")] == [
+            f"- **doc{i}.pdf**" for i in range(5)
+        ]
+        assert engine.page_calls == [(0, 2), (2, 2), (4, 2)]
+
+    def test_empty_knowledge_base(self, adapter, engine):
+        assert stream_documents(adapter) == "No documents found in the knowledge base."
+        assert engine.page_calls == [(0, mcp_http_adapter.DOCUMENT_STREAM_BATCH_SIZE)]